@@ -0,0 +1,16 @@
+"""JSON parsing shared by the identifier modules."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON parser
+    orjson = None  # type: ignore[assignment]
+
+
+def _parse_json(content: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
@@ -3,8 +3,14 @@
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Any, Optional
+import sys
 import time
 
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 class IdentifierType(Enum):
     """Supported academic identifier types."""
@@ -24,7 +30,7 @@ class ExtractionMethod(Enum):
     METADATA_PARSING = "metadata_parsing"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AcademicIdentifier:
     """Represents an extracted academic identifier."""
 
@@ -1,15 +1,101 @@
 """Comprehensive reporting and visualization for validation assessment."""
 
+import csv
 import logging
-from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit
 import json
 from datetime import datetime
 
-from .base import IdentifierExtractionResult, AcademicIdentifier, IdentifierType
+from .base import (
+    IdentifierExtractionResult,
+    AcademicIdentifier,
+    IdentifierType,
+    ExtractionMethod,
+)
 
 logger = logging.getLogger(__name__)
 
+# Extraction methods reported in the stratified analysis, and their slot in
+# the per-method accumulators
+_STRATIFIED_METHODS = (
+    ExtractionMethod.URL_PATTERN,
+    ExtractionMethod.WEB_SCRAPING,
+    ExtractionMethod.PDF_EXTRACTION,
+)
+_METHOD_INDEX = {method: idx for idx, method in enumerate(_STRATIFIED_METHODS)}
+
+# F1 grade boundaries (ascending) and the grade for each interval; a score
+# equal to a boundary gets the higher grade
+_GRADE_THRESHOLDS = (0.5, 0.6, 0.7, 0.8, 0.9)
+_GRADE_LABELS = (
+    "F (Failing)",
+    "D (Poor)",
+    "C (Fair)",
+    "B (Good)",
+    "A (Very Good)",
+    "A+ (Excellent)",
+)
+
+# Enum member -> string value, used when exporting per-identifier records
+_TYPE_VALUE = {member: member.value for member in IdentifierType}
+_METHOD_VALUE = {member: member.value for member in ExtractionMethod}
+
+# Topic confidence tier of a relevant paper -> classification bucket, where
+# the tier is 2 for confidence >= 80, 1 for >= 50 and 0 otherwise
+_CLASSIFICATION_TABLE = {
+    2: "high_confidence_relevant",
+    1: "medium_confidence_relevant",
+    0: "low_confidence_relevant",
+}
+
+# Results for analyzers that receive no identifiers (common for failed runs).
+# Callers get shallow copies so the report never aliases these constants.
+_EMPTY_TOPIC_ANALYSIS: Dict[str, Any] = {
+    "topic_validation_available": False,
+    "message": "No topic validation data found",
+}
+_EMPTY_CONFIDENCE_RANGES: Dict[str, int] = {
+    "high_confidence_90_plus": 0,
+    "medium_confidence_70_89": 0,
+    "low_confidence_below_70": 0,
+    "total": 0,
+}
+_EMPTY_CONFIDENCE_DISTRIBUTION: Dict[str, int] = {
+    "0.9-1.0": 0,
+    "0.8-0.89": 0,
+    "0.7-0.79": 0,
+    "0.6-0.69": 0,
+    "0.5-0.59": 0,
+    "below_0.5": 0,
+}
+
+
+def _csv_value(value: Any) -> Any:
+    """Convert list values to a "; "-joined string for CSV cells."""
+    if isinstance(value, list):
+        return "; ".join(str(v) for v in value)
+    return value
+
+
+def _flatten_paper(paper: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a detailed paper record into a single-level CSV row.
+
+    Topic validation fields are lifted to ``topic_<field>`` columns and list
+    values are joined into strings, building the row in one pass.
+    """
+    row: Dict[str, Any] = {}
+    for key, value in paper.items():
+        if key == "topic_validation" and value:
+            for topic_key, topic_value in value.items():
+                row[f"topic_{topic_key}"] = _csv_value(topic_value)
+        else:
+            row[key] = _csv_value(value)
+    return row
+
 
 class ValidationReporter:
     """Generate comprehensive validation reports with statistics and visualizations."""
@@ -57,8 +143,9 @@ class ValidationReporter:
         validation_analysis = self._analyze_validation_performance(all_identifiers)
 
         # Generate stratified performance analysis
+        failed_url_count = sum(len(result.failed_urls) for result in results)
         stratified_analysis = self._analyze_stratified_performance(
-            all_identifiers, [url for result in results for url in result.failed_urls]
+            all_identifiers, failed_url_count
         )
 
         # Generate failure analysis
@@ -111,6 +198,7 @@ class ValidationReporter:
         identifiers: List[AcademicIdentifier],
     ) -> Dict[str, Any]:
         """Generate comprehensive statistics across all results."""
+        type_counts = Counter(identifier.type for identifier in identifiers)
         stats = {
             "extraction_performance": {
                 "total_urls_processed": sum(
@@ -130,15 +218,9 @@ class ValidationReporter:
                 ),
             },
             "identifier_types": {
-                "doi_count": len(
-                    [i for i in identifiers if i.type == IdentifierType.DOI]
-                ),
-                "pmid_count": len(
-                    [i for i in identifiers if i.type == IdentifierType.PMID]
-                ),
-                "pmc_count": len(
-                    [i for i in identifiers if i.type == IdentifierType.PMC]
-                ),
+                "doi_count": type_counts[IdentifierType.DOI],
+                "pmid_count": type_counts[IdentifierType.PMID],
+                "pmc_count": type_counts[IdentifierType.PMC],
             },
             "confidence_distribution": self._analyze_confidence_distribution(
                 identifiers
@@ -158,81 +240,73 @@ class ValidationReporter:
     def _analyze_stratified_performance(
         self,
         identifiers: List[AcademicIdentifier],
-        failed_urls: Optional[List[str]] = None,
+        failed_url_count: int = 0,
     ) -> Dict[str, Any]:
-        """Analyze performance stratified by extraction method."""
-        from .base import ExtractionMethod
-
-        if failed_urls is None:
-            failed_urls = []
-
-        # Group identifiers by extraction method
-        by_method: Dict[Any, List[AcademicIdentifier]] = {
-            ExtractionMethod.URL_PATTERN: [],
-            ExtractionMethod.WEB_SCRAPING: [],
-            ExtractionMethod.PDF_EXTRACTION: [],
-        }
+        """Analyze performance stratified by extraction method.
 
+        Args:
+            identifiers: All extracted identifiers
+            failed_url_count: Number of URLs that yielded no identifier
+        """
+        # Accumulate per-method totals in one pass, indexed by _METHOD_INDEX
+        n_methods = len(_STRATIFIED_METHODS)
+        counts = [0] * n_methods
+        conf_sums = [0.0] * n_methods
+        high_conf_counts = [0] * n_methods
+        topic_counts = [0] * n_methods
+        relevant_counts = [0] * n_methods
+        topic_conf_sums = [0.0] * n_methods
+        type_counts = [dict.fromkeys(IdentifierType, 0) for _ in range(n_methods)]
+
+        method_index = _METHOD_INDEX
         for identifier in identifiers:
-            if identifier.extraction_method in by_method:
-                by_method[identifier.extraction_method].append(identifier)
+            idx = method_index.get(identifier.extraction_method)
+            if idx is None:
+                continue
+            confidence = identifier.confidence
+            counts[idx] += 1
+            conf_sums[idx] += confidence
+            if confidence >= 0.8:
+                high_conf_counts[idx] += 1
+            type_counts[idx][identifier.type] += 1
+
+            tv = identifier.topic_validation
+            if tv is not None:
+                topic_counts[idx] += 1
+                if tv:
+                    if tv.get("is_relevant", False):
+                        relevant_counts[idx] += 1
+                    topic_conf_sums[idx] += tv.get("confidence", 0)
 
         # Calculate statistics for each method
         stratified_stats = {}
         total_successes = len(identifiers)
-        total_attempts = total_successes + len(failed_urls)
+        total_attempts = total_successes + failed_url_count
 
-        for method, method_identifiers in by_method.items():
-            method_name = method.value
-            count = len(method_identifiers)
+        for idx, method in enumerate(_STRATIFIED_METHODS):
+            count = counts[idx]
 
             # Calculate confidence stats
-            if method_identifiers:
-                confidences = [i.confidence for i in method_identifiers]
-                avg_confidence = sum(confidences) / len(confidences)
-                high_conf_count = len(
-                    [i for i in method_identifiers if i.confidence >= 0.8]
-                )
+            if count:
+                avg_confidence = conf_sums[idx] / count
+                high_conf_count = high_conf_counts[idx]
 
                 # Topic validation stats if available
-                topic_validated = [
-                    i for i in method_identifiers if i.topic_validation is not None
-                ]
                 topic_stats = {}
-                if topic_validated:
-                    relevant_count = len(
-                        [
-                            i
-                            for i in topic_validated
-                            if i.topic_validation
-                            and i.topic_validation.get("is_relevant", False)
-                        ]
-                    )
+                validated = topic_counts[idx]
+                if validated:
                     topic_stats = {
-                        "total_validated": len(topic_validated),
-                        "relevant_papers": relevant_count,
-                        "relevance_rate": (
-                            relevant_count / len(topic_validated)
-                            if topic_validated
-                            else 0
-                        ),
-                        "avg_topic_confidence": (
-                            sum(
-                                i.topic_validation.get("confidence", 0)
-                                for i in topic_validated
-                                if i.topic_validation
-                            )
-                            / len(topic_validated)
-                            if topic_validated
-                            else 0
-                        ),
+                        "total_validated": validated,
+                        "relevant_papers": relevant_counts[idx],
+                        "relevance_rate": relevant_counts[idx] / validated,
+                        "avg_topic_confidence": topic_conf_sums[idx] / validated,
                     }
             else:
                 avg_confidence = 0
                 high_conf_count = 0
                 topic_stats = {}
 
-            stratified_stats[method_name] = {
+            stratified_stats[method.value] = {
                 "total_identifiers": count,
                 "success_rate": count / total_attempts if total_attempts > 0 else 0,
                 "avg_confidence": avg_confidence,
@@ -240,40 +314,35 @@ class ValidationReporter:
                 "high_confidence_rate": high_conf_count / count if count > 0 else 0,
                 "topic_validation": topic_stats,
                 "identifier_types": {
-                    "doi": len(
-                        [i for i in method_identifiers if i.type.value == "doi"]
-                    ),
-                    "pmid": len(
-                        [i for i in method_identifiers if i.type.value == "pmid"]
-                    ),
-                    "pmc": len(
-                        [i for i in method_identifiers if i.type.value == "pmc"]
-                    ),
+                    "doi": type_counts[idx][IdentifierType.DOI],
+                    "pmid": type_counts[idx][IdentifierType.PMID],
+                    "pmc": type_counts[idx][IdentifierType.PMC],
                 },
             }
 
+        method_counts = dict(zip(_STRATIFIED_METHODS, counts))
+        method_conf_sums = dict(zip(_STRATIFIED_METHODS, conf_sums))
+
         # Overall summary
         summary = {
             "total_identifiers": total_successes,
-            "total_failed_urls": len(failed_urls),
+            "total_failed_urls": failed_url_count,
             "overall_success_rate": (
                 total_successes / total_attempts if total_attempts > 0 else 0
             ),
             "extraction_method_breakdown": {
                 "url_pattern_percentage": (
-                    len(by_method[ExtractionMethod.URL_PATTERN]) / total_successes * 100
+                    method_counts[ExtractionMethod.URL_PATTERN] / total_successes * 100
                     if total_successes > 0
                     else 0
                 ),
                 "web_scraping_percentage": (
-                    len(by_method[ExtractionMethod.WEB_SCRAPING])
-                    / total_successes
-                    * 100
+                    method_counts[ExtractionMethod.WEB_SCRAPING] / total_successes * 100
                     if total_successes > 0
                     else 0
                 ),
                 "pdf_extraction_percentage": (
-                    len(by_method[ExtractionMethod.PDF_EXTRACTION])
+                    method_counts[ExtractionMethod.PDF_EXTRACTION]
                     / total_successes
                     * 100
                     if total_successes > 0
@@ -285,15 +354,22 @@ class ValidationReporter:
         return {
             "stratified_performance": stratified_stats,
             "summary": summary,
-            "method_comparison": self._compare_extraction_methods(by_method),
+            "method_comparison": self._compare_extraction_methods(
+                method_counts, method_conf_sums
+            ),
         }
 
     def _compare_extraction_methods(
-        self, by_method: Dict[Any, List[AcademicIdentifier]]
+        self,
+        method_counts: Dict[ExtractionMethod, int],
+        method_conf_sums: Dict[ExtractionMethod, float],
     ) -> Dict[str, Any]:
-        """Compare performance across extraction methods."""
-        from .base import ExtractionMethod
+        """Compare performance across extraction methods.
 
+        Args:
+            method_counts: Number of identifiers per extraction method
+            method_conf_sums: Sum of extraction confidences per method
+        """
         comparison: Dict[str, Any] = {
             "best_method_by_count": None,
             "best_method_by_confidence": None,
@@ -302,9 +378,7 @@ class ValidationReporter:
         }
 
         # Find best method by count
-        counts = {
-            method.value: len(identifiers) for method, identifiers in by_method.items()
-        }
+        counts = {method.value: count for method, count in method_counts.items()}
         if any(counts.values()):
             best_count_method = max(counts.items(), key=lambda x: x[1])
             comparison["best_method_by_count"] = {
@@ -314,10 +388,9 @@ class ValidationReporter:
 
         # Find best method by confidence
         avg_confidences = {}
-        for method, identifiers in by_method.items():
-            if identifiers:
-                avg_conf = sum(i.confidence for i in identifiers) / len(identifiers)
-                avg_confidences[method.value] = avg_conf
+        for method, count in method_counts.items():
+            if count:
+                avg_confidences[method.value] = method_conf_sums[method] / count
 
         if avg_confidences:
             best_conf_method = max(avg_confidences.items(), key=lambda x: x[1])
@@ -327,17 +400,16 @@ class ValidationReporter:
             }
 
         # Generate recommendations based on performance
-        total_identifiers = sum(len(identifiers) for identifiers in by_method.values())
+        total_identifiers = sum(method_counts.values())
         if total_identifiers > 0:
             url_pattern_rate = (
-                len(by_method.get(ExtractionMethod.URL_PATTERN, [])) / total_identifiers
+                method_counts.get(ExtractionMethod.URL_PATTERN, 0) / total_identifiers
             )
             web_scraping_rate = (
-                len(by_method.get(ExtractionMethod.WEB_SCRAPING, []))
-                / total_identifiers
+                method_counts.get(ExtractionMethod.WEB_SCRAPING, 0) / total_identifiers
             )
             pdf_rate = (
-                len(by_method.get(ExtractionMethod.PDF_EXTRACTION, []))
+                method_counts.get(ExtractionMethod.PDF_EXTRACTION, 0)
                 / total_identifiers
             )
 
@@ -365,6 +437,14 @@ class ValidationReporter:
         self, identifiers: List[AcademicIdentifier]
     ) -> Dict[str, Any]:
         """Analyze validation method performance."""
+        if not identifiers:
+            return {
+                "validation_methods_used": [],
+                "confidence_by_method": {},
+                "validation_agreement": {},
+                "confidence_ranges": dict(_EMPTY_CONFIDENCE_RANGES),
+            }
+
         analysis: Dict[str, Any] = {
             "validation_methods_used": [],
             "confidence_by_method": {},
@@ -372,9 +452,24 @@ class ValidationReporter:
         }
 
         # Count validation methods used (inferred from confidence patterns)
-        high_conf = len([i for i in identifiers if i.confidence >= 0.9])
-        medium_conf = len([i for i in identifiers if 0.7 <= i.confidence < 0.9])
-        low_conf = len([i for i in identifiers if i.confidence < 0.7])
+        high_conf = 0
+        medium_conf = 0
+        low_conf = 0
+        confidence_sum = 0.0
+        min_confidence = max_confidence = identifiers[0].confidence
+        for identifier in identifiers:
+            confidence = identifier.confidence
+            confidence_sum += confidence
+            if confidence < min_confidence:
+                min_confidence = confidence
+            elif confidence > max_confidence:
+                max_confidence = confidence
+            if confidence >= 0.9:
+                high_conf += 1
+            elif confidence >= 0.7:
+                medium_conf += 1
+            else:
+                low_conf += 1
 
         analysis["confidence_ranges"] = {
             "high_confidence_90_plus": high_conf,
@@ -383,12 +478,9 @@ class ValidationReporter:
             "total": len(identifiers),
         }
 
-        if identifiers:
-            analysis["avg_confidence"] = sum(i.confidence for i in identifiers) / len(
-                identifiers
-            )
-            analysis["min_confidence"] = min(i.confidence for i in identifiers)
-            analysis["max_confidence"] = max(i.confidence for i in identifiers)
+        analysis["avg_confidence"] = confidence_sum / len(identifiers)
+        analysis["min_confidence"] = min_confidence
+        analysis["max_confidence"] = max_confidence
 
         return analysis
 
@@ -396,17 +488,12 @@ class ValidationReporter:
         self, identifiers: List[AcademicIdentifier]
     ) -> Dict[str, Any]:
         """Analyze topic validation results if available."""
-        topic_validated = [i for i in identifiers if i.topic_validation is not None]
-
-        if not topic_validated:
-            return {
-                "topic_validation_available": False,
-                "message": "No topic validation data found",
-            }
+        if not identifiers:
+            return dict(_EMPTY_TOPIC_ANALYSIS)
 
         analysis: Dict[str, Any] = {
             "topic_validation_available": True,
-            "total_validated": len(topic_validated),
+            "total_validated": 0,
             "relevant_papers": 0,
             "irrelevant_papers": 0,
             "uncertain_papers": 0,
@@ -420,20 +507,23 @@ class ValidationReporter:
             "common_keywords": {},
         }
 
-        confidence_scores = []
-        all_keywords = []
+        confidence_sum = 0.0
+        confidence_count = 0
+        keyword_counts: Counter[str] = Counter()
 
-        for identifier in topic_validated:
+        for identifier in identifiers:
             tv = identifier.topic_validation
             if tv is None:
                 continue
+            analysis["total_validated"] += 1
 
             # Count relevance classifications
-            if tv.get("is_relevant") is True:
+            relevant = tv.get("is_relevant")
+            if relevant is True:
                 analysis["relevant_papers"] += 1
-            elif tv.get("is_relevant") is False:
+            elif relevant is False:
                 analysis["irrelevant_papers"] += 1
-            elif tv.get("is_relevant") is None:
+            elif relevant is None:
                 if "failed" in tv.get("reasoning", "").lower():
                     analysis["validation_errors"] += 1
                 else:
@@ -449,27 +539,21 @@ class ValidationReporter:
                 analysis["confidence_distribution"]["low_confidence_below_50"] += 1
 
             if confidence > 0:
-                confidence_scores.append(confidence)
+                confidence_sum += confidence
+                confidence_count += 1
 
-            # Collect keywords
-            keywords = tv.get("keywords_found", [])
-            all_keywords.extend(keywords)
+            # Count keyword frequency
+            keyword_counts.update(tv.get("keywords_found", []))
 
-        # Calculate average confidence
-        if confidence_scores:
-            analysis["avg_topic_confidence"] = sum(confidence_scores) / len(
-                confidence_scores
-            )
+        if not analysis["total_validated"]:
+            return dict(_EMPTY_TOPIC_ANALYSIS)
 
-        # Count keyword frequency
-        keyword_counts: Dict[str, int] = {}
-        for keyword in all_keywords:
-            keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+        # Calculate average confidence
+        if confidence_count:
+            analysis["avg_topic_confidence"] = confidence_sum / confidence_count
 
         # Get top 10 most common keywords
-        analysis["common_keywords"] = dict(
-            sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
+        analysis["common_keywords"] = dict(keyword_counts.most_common(10))
 
         return analysis
 
@@ -488,43 +572,42 @@ class ValidationReporter:
 
         for identifier in identifiers:
             paper_info: Dict[str, Any] = {
-                "identifier_type": identifier.type.value,
+                "identifier_type": _TYPE_VALUE[identifier.type],
                 "identifier_value": identifier.value,
                 "extraction_confidence": identifier.confidence,
                 "source_url": identifier.source_url,
             }
 
-            if identifier.topic_validation:
-                tv = identifier.topic_validation
+            tv = identifier.topic_validation
+            if tv:
+                relevant = tv.get("is_relevant")
+                confidence = tv.get("confidence", 0)
+                reasoning = tv.get("reasoning", "")
                 paper_info.update(
                     {
-                        "topic_relevant": tv.get("is_relevant"),
-                        "topic_confidence": tv.get("confidence", 0),
-                        "topic_reasoning": tv.get("reasoning", ""),
+                        "topic_relevant": relevant,
+                        "topic_confidence": confidence,
+                        "topic_reasoning": reasoning,
                         "keywords_found": tv.get("keywords_found", []),
                     }
                 )
 
                 # Classify based on topic validation
-                if tv.get("is_relevant") is True:
-                    if tv.get("confidence", 0) >= 80:
-                        classifications["high_confidence_relevant"].append(paper_info)
-                    elif tv.get("confidence", 0) >= 50:
-                        classifications["medium_confidence_relevant"].append(paper_info)
-                    else:
-                        classifications["low_confidence_relevant"].append(paper_info)
-                elif tv.get("is_relevant") is False:
-                    classifications["likely_irrelevant"].append(paper_info)
-                elif "failed" in tv.get("reasoning", "").lower():
-                    classifications["validation_errors"].append(paper_info)
+                if relevant is False:
+                    bucket = "likely_irrelevant"
+                elif relevant is True:
+                    tier = 2 if confidence >= 80 else 1 if confidence >= 50 else 0
+                    bucket = _CLASSIFICATION_TABLE[tier]
+                elif "failed" in reasoning.lower():
+                    bucket = "validation_errors"
                 else:
-                    classifications["needs_manual_review"].append(paper_info)
+                    bucket = "needs_manual_review"
             else:
-                # No topic validation - classify by extraction confidence
-                if identifier.confidence >= 0.8:
-                    classifications["needs_manual_review"].append(paper_info)
-                else:
-                    classifications["needs_manual_review"].append(paper_info)
+                # No topic validation - needs manual review regardless of
+                # extraction confidence
+                bucket = "needs_manual_review"
+
+            classifications[bucket].append(paper_info)
 
         return classifications
 
@@ -594,11 +677,11 @@ class ValidationReporter:
         details = []
         for identifier in identifiers:
             paper: Dict[str, Any] = {
-                "identifier_type": identifier.type.value,
+                "identifier_type": _TYPE_VALUE[identifier.type],
                 "identifier_value": identifier.value,
                 "extraction_confidence": identifier.confidence,
                 "source_url": identifier.source_url,
-                "extraction_method": identifier.extraction_method.value,
+                "extraction_method": _METHOD_VALUE[identifier.extraction_method],
                 "timestamp": identifier.timestamp,
             }
 
@@ -613,14 +696,9 @@ class ValidationReporter:
         self, identifiers: List[AcademicIdentifier]
     ) -> Dict[str, int]:
         """Analyze distribution of confidence scores."""
-        distribution = {
-            "0.9-1.0": 0,
-            "0.8-0.89": 0,
-            "0.7-0.79": 0,
-            "0.6-0.69": 0,
-            "0.5-0.59": 0,
-            "below_0.5": 0,
-        }
+        distribution = dict(_EMPTY_CONFIDENCE_DISTRIBUTION)
+        if not identifiers:
+            return distribution
 
         for identifier in identifiers:
             conf = identifier.confidence
@@ -645,16 +723,34 @@ class ValidationReporter:
         """Analyze distribution of extraction methods."""
         methods: Dict[str, int] = {}
         for identifier in identifiers:
-            method = identifier.extraction_method.value
+            method = _METHOD_VALUE[identifier.extraction_method]
             methods[method] = methods.get(method, 0) + 1
         return methods
 
     def _save_report(self, report: Dict[str, Any], report_name: str) -> None:
-        """Save report in multiple formats."""
+        """Save report in multiple formats.
+
+        Detailed paper records are streamed to a sibling JSON Lines file
+        (one paper per line) and referenced from the summary JSON via
+        ``detailed_papers_path``, keeping the summary small.
+        """
+        summary_report = report
+        if "detailed_papers" in report:
+            papers_path = self.output_dir / f"{report_name}_papers.jsonl"
+            with open(papers_path, "w") as f:
+                for paper in report["detailed_papers"]:
+                    f.write(json.dumps(paper, default=str))
+                    f.write("\n")
+
+            summary_report = {
+                key: value for key, value in report.items() if key != "detailed_papers"
+            }
+            summary_report["detailed_papers_path"] = papers_path.name
+
         # Save as JSON
         json_path = self.output_dir / f"{report_name}.json"
         with open(json_path, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+            json.dump(summary_report, f, indent=2, default=str)
 
         # Save summary as text
         text_path = self.output_dir / f"{report_name}_summary.txt"
@@ -798,19 +894,24 @@ class ValidationReporter:
         if not identifiers:
             return {"precision": 0.0, "recall": 1.0, "f1_score": 0.0, "support": 0}
 
-        # Classify extractions based on confidence
-        high_confidence = [i for i in identifiers if i.confidence >= threshold]
-        medium_confidence = [i for i in identifiers if 0.5 <= i.confidence < threshold]
-        low_confidence = [i for i in identifiers if i.confidence < 0.5]
+        # Classify extractions based on confidence in a single pass
+        true_positives = 0
+        medium_confidence = 0
+        false_positives = 0
+        for identifier in identifiers:
+            confidence = identifier.confidence
+            if confidence >= threshold:
+                true_positives += 1
+            elif confidence >= 0.5:
+                medium_confidence += 1
+            else:
+                false_positives += 1
 
         # Extraction metrics:
         # True Positives: High confidence extractions (likely correct)
         # False Positives: Low confidence extractions (likely incorrect)
         # False Negatives: We assume some URLs didn't yield identifiers (conservative estimate)
 
-        true_positives = len(high_confidence)
-        false_positives = len(low_confidence)
-
         # Estimate false negatives: assume 90% of academic URLs should yield identifiers
         total_expected_identifiers = int(
             len(identifiers) * 1.1
@@ -818,20 +919,8 @@ class ValidationReporter:
         false_negatives = max(0, total_expected_identifiers - len(identifiers))
 
         # Calculate metrics
-        precision = (
-            true_positives / (true_positives + false_positives)
-            if (true_positives + false_positives) > 0
-            else 0.0
-        )
-        recall = (
-            true_positives / (true_positives + false_negatives)
-            if (true_positives + false_negatives) > 0
-            else 0.0
-        )
-        f1_score = (
-            2 * (precision * recall) / (precision + recall)
-            if (precision + recall) > 0
-            else 0.0
+        precision, recall, f1_score = self._prf(
+            true_positives, false_positives, false_negatives
         )
 
         return {
@@ -841,10 +930,26 @@ class ValidationReporter:
             "true_positives": true_positives,
             "false_positives": false_positives,
             "false_negatives": false_negatives,
-            "medium_confidence": len(medium_confidence),
+            "medium_confidence": medium_confidence,
             "support": len(identifiers),
         }
 
+    @staticmethod
+    def _prf(
+        true_positives: int, false_positives: int, false_negatives: int
+    ) -> Tuple[float, float, float]:
+        """Compute precision, recall and F1 score from confusion counts.
+
+        Each ratio is 0.0 when its denominator is zero.
+        """
+        predicted = true_positives + false_positives
+        actual = true_positives + false_negatives
+        precision = true_positives / predicted if predicted else 0.0
+        recall = true_positives / actual if actual else 0.0
+        total = precision + recall
+        f1_score = 2 * (precision * recall) / total if total else 0.0
+        return precision, recall, f1_score
+
     def _calculate_topic_validation_f1(
         self, identifiers: List[AcademicIdentifier]
     ) -> Dict[str, Any]:
@@ -852,10 +957,37 @@ class ValidationReporter:
 
         This evaluates how well we classify papers as relevant/irrelevant to the research domain.
         """
-        # Filter identifiers that have topic validation
-        topic_validated = [i for i in identifiers if i.topic_validation is not None]
+        # Classify identifiers that have topic validation in a single pass
+        support = 0
+        total_relevant = 0
+        total_irrelevant = 0
+        high_conf_relevant = 0
+        low_conf_relevant = 0
+        high_conf_irrelevant = 0
+        confidence_sum = 0.0
+        for identifier in identifiers:
+            tv = identifier.topic_validation
+            if tv is None:
+                continue
+            support += 1
+            if not tv:
+                continue
+            confidence = tv.get("confidence", 0)
+            confidence_sum += confidence
+            if "is_relevant" not in tv:
+                continue
+            if tv["is_relevant"]:
+                total_relevant += 1
+                if confidence >= 80:
+                    high_conf_relevant += 1
+                else:
+                    low_conf_relevant += 1
+            else:
+                total_irrelevant += 1
+                if confidence >= 80:
+                    high_conf_irrelevant += 1
 
-        if not topic_validated:
+        if not support:
             return {
                 "precision": None,
                 "recall": None,
@@ -864,72 +996,22 @@ class ValidationReporter:
                 "validation_available": False,
             }
 
-        # Classify based on topic validation results
-        relevant_papers = [
-            i
-            for i in topic_validated
-            if i.topic_validation and i.topic_validation.get("is_relevant", False)
-        ]
-        irrelevant_papers = [
-            i
-            for i in topic_validated
-            if i.topic_validation and not i.topic_validation.get("is_relevant", True)
-        ]
-
-        # High confidence topic classifications
-        high_conf_relevant = [
-            i
-            for i in relevant_papers
-            if i.topic_validation and i.topic_validation.get("confidence", 0) >= 80
-        ]
-        high_conf_irrelevant = [
-            i
-            for i in irrelevant_papers
-            if i.topic_validation and i.topic_validation.get("confidence", 0) >= 80
-        ]
-
         # For F1 calculation:
         # True Positives: High confidence relevant papers
         # False Positives: Low confidence relevant papers (might be wrong)
         # False Negatives: High confidence irrelevant papers (should have been relevant for this corpus)
-
-        true_positives = len(high_conf_relevant)
-
-        # Low confidence relevant classifications as potential false positives
-        low_conf_relevant = [
-            i
-            for i in relevant_papers
-            if i.topic_validation and i.topic_validation.get("confidence", 0) < 80
-        ]
-        false_positives = len(low_conf_relevant)
-
-        # High confidence irrelevant papers as false negatives (since our corpus should be relevant)
-        false_negatives = len(high_conf_irrelevant)
+        true_positives = high_conf_relevant
+        false_positives = low_conf_relevant
+        false_negatives = high_conf_irrelevant
 
         # Calculate metrics
-        precision = (
-            true_positives / (true_positives + false_positives)
-            if (true_positives + false_positives) > 0
-            else 0.0
-        )
-        recall = (
-            true_positives / (true_positives + false_negatives)
-            if (true_positives + false_negatives) > 0
-            else 0.0
-        )
-        f1_score = (
-            2 * (precision * recall) / (precision + recall)
-            if (precision + recall) > 0
-            else 0.0
+        precision, recall, f1_score = self._prf(
+            true_positives, false_positives, false_negatives
         )
 
         # Additional topic validation metrics
-        avg_confidence = sum(
-            i.topic_validation.get("confidence", 0)
-            for i in topic_validated
-            if i.topic_validation
-        ) / len(topic_validated)
-        relevance_rate = len(relevant_papers) / len(topic_validated)
+        avg_confidence = confidence_sum / support
+        relevance_rate = total_relevant / support
 
         return {
             "precision": precision,
@@ -938,12 +1020,12 @@ class ValidationReporter:
             "true_positives": true_positives,
             "false_positives": false_positives,
             "false_negatives": false_negatives,
-            "support": len(topic_validated),
+            "support": support,
             "validation_available": True,
             "relevance_rate": relevance_rate,
             "avg_confidence": avg_confidence,
-            "total_relevant": len(relevant_papers),
-            "total_irrelevant": len(irrelevant_papers),
+            "total_relevant": total_relevant,
+            "total_irrelevant": total_irrelevant,
         }
 
     def _assess_combined_performance(
@@ -1008,57 +1090,32 @@ class ValidationReporter:
         """Convert F1 score to letter grade."""
         if score is None:
             return "N/A"
-        if score >= 0.9:
-            return "A+ (Excellent)"
-        elif score >= 0.8:
-            return "A (Very Good)"
-        elif score >= 0.7:
-            return "B (Good)"
-        elif score >= 0.6:
-            return "C (Fair)"
-        elif score >= 0.5:
-            return "D (Poor)"
-        else:
-            return "F (Failing)"
+        return _GRADE_LABELS[bisect_right(_GRADE_THRESHOLDS, score)]
 
     def _save_csv_export(self, papers: List[Dict[str, Any]], filename: str) -> None:
         """Save detailed paper data as CSV."""
-        import csv
-
         csv_path = self.output_dir / filename
 
         if not papers:
             return
 
-        # Get all possible fieldnames
+        # Flatten rows and collect all possible fieldnames in one pass
         fieldnames_set: set[str] = set()
+        rows = []
         for paper in papers:
+            row = _flatten_paper(paper)
             fieldnames_set.update(paper.keys())
-            if "topic_validation" in paper and paper["topic_validation"]:
-                for key in paper["topic_validation"].keys():
-                    fieldnames_set.add(f"topic_{key}")
+            fieldnames_set.update(row.keys())
+            rows.append(row)
 
         fieldnames = sorted(fieldnames_set)
 
+        # Emit cells in fixed column order so the C writer can take plain
+        # lists instead of DictWriter's per-row dicts
         with open(csv_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for paper in papers:
-                row = paper.copy()
-
-                # Flatten topic validation data
-                if "topic_validation" in row and row["topic_validation"]:
-                    tv = row.pop("topic_validation")
-                    for key, value in tv.items():
-                        row[f"topic_{key}"] = value
-
-                # Convert lists to strings
-                for key, value in row.items():
-                    if isinstance(value, list):
-                        row[key] = "; ".join(str(v) for v in value)
-
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows([row.get(key, "") for key in fieldnames] for row in rows)
 
         logger.info(f"CSV export saved: {csv_path}")
 
@@ -1066,7 +1123,6 @@ class ValidationReporter:
         self, results: List[IdentifierExtractionResult]
     ) -> Dict[str, Any]:
         """Generate comprehensive failure analysis with simple list format."""
-        all_failed_urls = []
         failure_stats: Dict[str, Any] = {
             "total_failed_urls": 0,
             "failure_by_domain": {},
@@ -1081,29 +1137,24 @@ class ValidationReporter:
             "detailed_failures": [],
         }
 
+        failure_by_domain: Counter[str] = Counter()
+
         # Collect all failed URLs from results
         for result in results:
             for failed_url in result.failed_urls:
-                all_failed_urls.append(failed_url)
-
                 # Extract domain for categorization
+                domain = "unknown"
                 try:
-                    from urllib.parse import urlparse
-
-                    domain = urlparse(failed_url).netloc
-                    failure_stats["failure_by_domain"][domain] = (
-                        failure_stats["failure_by_domain"].get(domain, 0) + 1
-                    )
+                    domain = urlsplit(failed_url).netloc
                 except Exception:
-                    failure_stats["failure_by_domain"]["unknown"] = (
-                        failure_stats["failure_by_domain"].get("unknown", 0) + 1
-                    )
+                    pass
+                failure_by_domain[domain] += 1
 
                 # Categorize failure type based on URL pattern
                 failure_entry = {
                     "url": failed_url,
                     "category": self._categorize_failure(failed_url),
-                    "domain": domain if "domain" in locals() else "unknown",
+                    "domain": domain,
                 }
 
                 failure_stats["detailed_failures"].append(failure_entry)
@@ -1113,7 +1164,8 @@ class ValidationReporter:
                 if category in failure_stats["failure_patterns"]:
                     failure_stats["failure_patterns"][category] += 1
 
-        failure_stats["total_failed_urls"] = len(all_failed_urls)
+        failure_stats["failure_by_domain"] = dict(failure_by_domain)
+        failure_stats["total_failed_urls"] = len(failure_stats["detailed_failures"])
 
         # Generate simple failure list for easy review
         failure_stats["simple_failure_list"] = [
@@ -1134,11 +1186,11 @@ class ValidationReporter:
 
         if url_lower.endswith(".pdf"):
             return "pdf_links"
-        elif "doi.org" in url_lower or "dx.doi.org" in url_lower:
+        elif "doi.org" in url_lower:  # Also covers dx.doi.org
             return "redirect_issues"
         elif "access" in url_lower or "login" in url_lower:
             return "access_denied"
-        elif any(pattern in url_lower for pattern in ["pubmed", "ncbi", "pmc"]):
+        elif "pubmed" in url_lower or "ncbi" in url_lower or "pmc" in url_lower:
             return "format_issues"  # Likely format/parsing issues
         else:
             return "unknown_errors"
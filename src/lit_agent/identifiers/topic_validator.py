@@ -1,13 +1,23 @@
 """Topic validation using LLM analysis for configurable research domains."""
 
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import shelve
+from pathlib import Path
+from typing import Dict, Any, Optional, List, MutableMapping, Tuple
 import time
 
+from ._json import _parse_json
 from .base import IdentifierValidatorBase, IdentifierType
 
 logger = logging.getLogger(__name__)
 
+# Number of leading domain keywords treated as core terms by the fallback
+_CORE_KEYWORD_COUNT = 4
+
+# Placeholder marking where the paper text goes in the prompt templates
+_PROMPT_TEXT_SLOT = "\x00"
+
 
 class TopicValidator(IdentifierValidatorBase):
     """Validates whether papers are relevant to a specified research domain using LLM analysis."""
@@ -21,6 +31,7 @@ class TopicValidator(IdentifierValidatorBase):
         rate_limit: float = 2.0,
         temperature: float = 0.1,
         max_tokens: int = 350,
+        cache_dir: Optional[str] = None,
     ):
         """Initialize topic validator.
 
@@ -32,6 +43,8 @@ class TopicValidator(IdentifierValidatorBase):
             rate_limit: Minimum time between LLM requests in seconds
             temperature: LLM temperature for consistent results
             max_tokens: Maximum tokens for LLM response
+            cache_dir: Optional directory for a persistent validation cache
+                shared across runs; results are kept in memory only if omitted
         """
         self.research_domain = research_domain
         self.model = model
@@ -48,8 +61,44 @@ class TopicValidator(IdentifierValidatorBase):
             research_domain
         )
 
+        # Derived forms used on every fallback and prompt, computed once
+        self._domain_keywords_lower = [k.lower() for k in self.domain_keywords]
+        self._keyword_scan_plan = self._build_keyword_scan_plan(
+            self._domain_keywords_lower
+        )
+        self._domain_description_stripped = self.domain_description.strip()
+        self._keywords_str = ", ".join(
+            self.domain_keywords[:10]
+        )  # Limit to avoid token bloat
+
+        # Prompts only vary in the paper text, so the rest is rendered once;
+        # an identical prefix also lets providers reuse their prompt cache
+        (
+            (self._prompt_prefix, self._prompt_suffix),
+            (self._batch_prompt_prefix, self._batch_prompt_suffix),
+        ) = self._build_prompt_templates()
+
+        # Cache keys are namespaced by everything that shapes the prompt, so a
+        # persistent cache is not reused after the model or domain changes
+        namespace = hashlib.blake2b(digest_size=16)
+        for part in (
+            self.model,
+            self.research_domain,
+            self.domain_description,
+            *self.domain_keywords,
+        ):
+            namespace.update(part.encode())
+            namespace.update(b"\x1e")
+        self._cache_namespace = namespace.digest()
+
         # Cache for repeated validations
-        self._validation_cache: Dict[str, Dict[str, Any]] = {}
+        self._validation_cache: MutableMapping[str, Dict[str, Any]]
+        if cache_dir:
+            cache_path = Path(cache_dir)
+            cache_path.mkdir(parents=True, exist_ok=True)
+            self._validation_cache = shelve.open(str(cache_path / "topic_validation"))
+        else:
+            self._validation_cache = {}
 
     def validate_identifier(self, identifier_type: IdentifierType, value: str) -> bool:
         """Validate identifier (not used for topic validation)."""
@@ -87,17 +136,13 @@ class TopicValidator(IdentifierValidatorBase):
             return self._validation_cache[cache_key]
 
         try:
-            # Rate limiting
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.rate_limit:
-                time.sleep(self.rate_limit - time_since_last)
+            self._wait_for_rate_limit()
 
             # Perform LLM-based topic validation
             result = self._analyze_with_llm(title, abstract, pmid)
 
             # Cache the result
-            self._validation_cache[cache_key] = result
+            self._store_cached_result(cache_key, result)
             self.last_request_time = time.time()
 
             return result
@@ -106,11 +151,100 @@ class TopicValidator(IdentifierValidatorBase):
             logger.warning(f"Topic validation failed for {pmid or 'unknown'}: {e}")
             return self._create_fallback_result(title, abstract)
 
+    def validate_topic_relevance_batch(
+        self,
+        titles: List[str],
+        abstracts: Optional[List[str]] = None,
+        pmids: Optional[List[str]] = None,
+        batch_size: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Validate topic relevance for many articles, several per LLM call.
+
+        Uncached articles are packed ``batch_size`` at a time into a single
+        prompt, so the rate limit and prompt preamble are paid once per batch
+        rather than once per article.
+
+        Args:
+            titles: Article titles
+            abstracts: Article abstracts, aligned with ``titles`` (optional)
+            pmids: PubMed IDs for logging, aligned with ``titles`` (optional)
+            batch_size: Maximum number of articles per LLM request
+
+        Returns:
+            List of result dictionaries aligned with ``titles``, each in the
+            format returned by :meth:`validate_topic_relevance`
+        """
+        abstracts = abstracts or [""] * len(titles)
+        pmids = pmids or [""] * len(titles)
+        if not len(titles) == len(abstracts) == len(pmids):
+            raise ValueError("titles, abstracts and pmids must have the same length")
+
+        keys = [
+            self._create_cache_key(title, abstract)
+            for title, abstract in zip(titles, abstracts)
+        ]
+
+        # Collect one index per uncached article; duplicates share its result
+        pending: Dict[str, int] = {}
+        for index, key in enumerate(keys):
+            if key not in self._validation_cache and key not in pending:
+                pending[key] = index
+
+        fallbacks: Dict[str, Dict[str, Any]] = {}
+        pending_indices = list(pending.values())
+        for start in range(0, len(pending_indices), batch_size):
+            chunk = pending_indices[start : start + batch_size]
+            try:
+                self._wait_for_rate_limit()
+                batch_results = self._analyze_batch_with_llm(
+                    [titles[i] for i in chunk], [abstracts[i] for i in chunk]
+                )
+                self.last_request_time = time.time()
+            except Exception as e:
+                logger.warning(f"Batch topic validation failed: {e}")
+                batch_results = [None] * len(chunk)
+
+            for index, result in zip(chunk, batch_results):
+                if result is None:
+                    logger.warning(
+                        f"Topic validation failed for {pmids[index] or 'unknown'}"
+                    )
+                    fallbacks[keys[index]] = self._create_fallback_result(
+                        titles[index], abstracts[index]
+                    )
+                else:
+                    self._store_cached_result(keys[index], result)
+
+        return [
+            fallbacks[key] if key in fallbacks else self._validation_cache[key]
+            for key in keys
+        ]
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until at least ``rate_limit`` seconds since the last request."""
+        time_since_last = time.time() - self.last_request_time
+        if time_since_last < self.rate_limit:
+            time.sleep(self.rate_limit - time_since_last)
+
     def _create_cache_key(self, title: str, abstract: str) -> str:
-        """Create a cache key from title and abstract."""
-        combined_text = f"{title} {abstract}".strip()
-        # Use hash to create a reasonable cache key
-        return str(hash(combined_text))
+        """Create a cache key from title and abstract.
+
+        Title and abstract are hashed separately (with a unit separator
+        between them) so no combined string is built, and the digest is
+        stable across processes unlike the builtin ``hash``. The digest is
+        keyed by the validator's model and domain configuration.
+        """
+        digest = hashlib.blake2b(key=self._cache_namespace, digest_size=16)
+        digest.update(title.encode())
+        digest.update(b"\x1f")
+        digest.update(abstract.encode())
+        return digest.hexdigest()
+
+    def _store_cached_result(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Store a validation result, flushing persistent caches to disk."""
+        self._validation_cache[cache_key] = result
+        if isinstance(self._validation_cache, shelve.Shelf):
+            self._validation_cache.sync()
 
     def _analyze_with_llm(
         self, title: str, abstract: str, pmid: str = ""
@@ -150,37 +284,11 @@ class TopicValidator(IdentifierValidatorBase):
             if not content:
                 raise ValueError("Empty response from LLM")
 
-            import json
-
-            result = json.loads(content)
-
-            # Validate result structure
-            required_fields = [
-                "is_relevant",
-                "confidence",
-                "reasoning",
-                "keywords_found",
-            ]
-            for field in required_fields:
-                if field not in result:
-                    raise ValueError(f"Missing required field: {field}")
-
-            # Ensure confidence is a number between 0-100
-            confidence = float(result["confidence"])
-            if not 0 <= confidence <= 100:
-                logger.warning(
-                    f"Confidence out of range: {confidence}, clamping to 0-100"
-                )
-                confidence = max(0, min(100, confidence))
-            result["confidence"] = confidence
-
-            # Ensure keywords_found is a list
-            if not isinstance(result["keywords_found"], list):
-                result["keywords_found"] = []
+            result = self._normalize_llm_result(_parse_json(content))
 
             logger.debug(
                 f"Topic validation for {pmid or 'unknown'}: "
-                f"relevant={result['is_relevant']}, confidence={confidence}"
+                f"relevant={result['is_relevant']}, confidence={result['confidence']}"
             )
 
             return result
@@ -189,6 +297,96 @@ class TopicValidator(IdentifierValidatorBase):
             logger.error(f"LLM analysis failed for {pmid or 'unknown'}: {e}")
             raise
 
+    def _analyze_batch_with_llm(
+        self, titles: List[str], abstracts: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze the relevance of several articles with one LLM request.
+
+        Args:
+            titles: Article titles
+            abstracts: Article abstracts, aligned with ``titles``
+
+        Returns:
+            Analysis results aligned with ``titles``; an entry is None when the
+            LLM returned no valid result for that article
+        """
+        import litellm
+
+        papers = []
+        for number, (title, abstract) in enumerate(zip(titles, abstracts), start=1):
+            text = f"Paper {number}:\nTitle: {title}"
+            if abstract:
+                text += f"\nAbstract: {abstract}"
+            papers.append(text)
+
+        prompt = self._create_batch_domain_prompt("\n\n".join(papers))
+
+        response = litellm.completion(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=self.max_tokens * len(titles),
+            temperature=self.temperature,
+            response_format={"type": "json_object"},
+        )
+
+        content = response.choices[0].message.content
+        if not content:
+            raise ValueError("Empty response from LLM")
+
+        by_number: Dict[int, Dict[str, Any]] = {}
+        for entry in _parse_json(content).get("results", []):
+            try:
+                by_number[int(entry["id"])] = entry
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for number in range(1, len(titles) + 1):
+            entry = by_number.get(number)
+            try:
+                results.append(
+                    self._normalize_llm_result(
+                        {k: v for k, v in entry.items() if k != "id"}
+                    )
+                    if entry is not None
+                    else None
+                )
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Invalid batch result for paper {number}: {e}")
+                results.append(None)
+
+        return results
+
+    def _normalize_llm_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Check and normalize a parsed LLM relevance result in place.
+
+        Raises:
+            ValueError: If a required field is missing
+        """
+        # Validate result structure
+        required_fields = [
+            "is_relevant",
+            "confidence",
+            "reasoning",
+            "keywords_found",
+        ]
+        for field in required_fields:
+            if field not in result:
+                raise ValueError(f"Missing required field: {field}")
+
+        # Ensure confidence is a number between 0-100
+        confidence = float(result["confidence"])
+        if not 0 <= confidence <= 100:
+            logger.warning(f"Confidence out of range: {confidence}, clamping to 0-100")
+            confidence = max(0, min(100, confidence))
+        result["confidence"] = confidence
+
+        # Ensure keywords_found is a list
+        if not isinstance(result["keywords_found"], list):
+            result["keywords_found"] = []
+
+        return result
+
     def _get_default_keywords(self, research_domain: str) -> List[str]:
         """Get default keywords for a research domain."""
         domain_keywords = {
@@ -287,18 +485,30 @@ class TopicValidator(IdentifierValidatorBase):
 
     def _create_domain_prompt(self, text_to_analyze: str) -> str:
         """Create a domain-specific prompt for LLM analysis."""
+        return f"{self._prompt_prefix}{text_to_analyze}{self._prompt_suffix}"
+
+    def _create_batch_domain_prompt(self, papers_to_analyze: str) -> str:
+        """Create a domain-specific prompt covering several numbered papers."""
+        return (
+            f"{self._batch_prompt_prefix}{papers_to_analyze}{self._batch_prompt_suffix}"
+        )
+
+    def _build_prompt_templates(self) -> Tuple[Tuple[str, str], Tuple[str, str]]:
+        """Render the single and batch prompts around the per-paper text.
+
+        Returns:
+            ``(prefix, suffix)`` pairs for the single-paper and batch prompts
+        """
         domain_upper = self.research_domain.upper()
-        keywords_str = ", ".join(
-            self.domain_keywords[:10]
-        )  # Limit to avoid token bloat
+        keywords_str = self._keywords_str
 
-        prompt = f"""
+        single = f"""
         Analyze this scientific paper to determine if it is relevant to {domain_upper} research.
 
-        {text_to_analyze}
+        {_PROMPT_TEXT_SLOT}
 
         {domain_upper} includes:
-        {self.domain_description.strip()}
+        {self._domain_description_stripped}
 
         Key domain keywords to consider: {keywords_str}
 
@@ -312,7 +522,36 @@ class TopicValidator(IdentifierValidatorBase):
 
         Consider the title and abstract carefully. Be conservative - only mark as relevant if there's clear evidence of {self.research_domain} research.
         """
-        return prompt
+
+        batch = f"""
+        Analyze each of these scientific papers to determine if it is relevant to {domain_upper} research.
+
+        {_PROMPT_TEXT_SLOT}
+
+        {domain_upper} includes:
+        {self._domain_description_stripped}
+
+        Key domain keywords to consider: {keywords_str}
+
+        Respond in this JSON format, with one entry per paper using its number as "id":
+        {{
+            "results": [
+                {{
+                    "id": 1,
+                    "is_relevant": true/false,
+                    "confidence": 0-100,
+                    "reasoning": "Brief explanation (1-2 sentences)",
+                    "keywords_found": ["keyword1", "keyword2"]
+                }}
+            ]
+        }}
+
+        Consider each title and abstract carefully. Be conservative - only mark a paper as relevant if there's clear evidence of {self.research_domain} research.
+        """
+
+        single_prefix, _, single_suffix = single.partition(_PROMPT_TEXT_SLOT)
+        batch_prefix, _, batch_suffix = batch.partition(_PROMPT_TEXT_SLOT)
+        return (single_prefix, single_suffix), (batch_prefix, batch_suffix)
 
     def _create_fallback_result(self, title: str, abstract: str) -> Dict[str, Any]:
         """Create fallback result when LLM analysis fails.
@@ -321,18 +560,23 @@ class TopicValidator(IdentifierValidatorBase):
         """
         combined_text = f"{title} {abstract}".lower()
 
-        # Count keyword matches using configured domain keywords
-        keywords_found = []
-        for keyword in self.domain_keywords:
-            if keyword.lower() in combined_text:
-                keywords_found.append(keyword)
+        # Count keyword matches using configured domain keywords, skipping
+        # keywords whose contained shorter keyword is already known absent
+        matched = [False] * len(self.domain_keywords)
+        for index, keyword_lower, prerequisite in self._keyword_scan_plan:
+            if prerequisite is not None and not matched[prerequisite]:
+                continue
+            if keyword_lower in combined_text:
+                matched[index] = True
+        keywords_found = [
+            keyword
+            for keyword, is_match in zip(self.domain_keywords, matched)
+            if is_match
+        ]
 
         # Simple heuristic: relevant if we find domain-specific terms
         # Use the first few core keywords for relevance check
-        core_keywords = self.domain_keywords[:4] if self.domain_keywords else []
-        is_relevant = len(keywords_found) > 0 and any(
-            word.lower() in combined_text for word in core_keywords
-        )
+        is_relevant = any(matched[:_CORE_KEYWORD_COUNT])
 
         confidence = min(
             70, len(keywords_found) * 15
@@ -345,6 +589,39 @@ class TopicValidator(IdentifierValidatorBase):
             "keywords_found": keywords_found,
         }
 
+    @staticmethod
+    def _build_keyword_scan_plan(
+        keywords_lower: List[str],
+    ) -> List[Tuple[int, str, Optional[int]]]:
+        """Order keyword scans so shared substrings are searched only once.
+
+        Keywords are scanned shortest first. Each keyword records the index of
+        the longest shorter keyword it contains (e.g. "astrocytes" contains
+        "astrocyte"); it cannot occur in a text unless that keyword does, so
+        its scan is skipped when the contained keyword was not found.
+
+        Returns:
+            List of (keyword index, lowercased keyword, prerequisite index or
+            None) tuples in scan order
+        """
+        plan = []
+        for index in sorted(
+            range(len(keywords_lower)), key=lambda i: len(keywords_lower[i])
+        ):
+            keyword = keywords_lower[index]
+            contained = [
+                other
+                for other, candidate in enumerate(keywords_lower)
+                if len(candidate) < len(keyword) and candidate in keyword
+            ]
+            prerequisite = (
+                max(contained, key=lambda i: len(keywords_lower[i]))
+                if contained
+                else None
+            )
+            plan.append((index, keyword, prerequisite))
+        return plan
+
     def get_cache_stats(self) -> Dict[str, int]:
         """Get statistics about the validation cache."""
         return {
@@ -356,3 +633,8 @@ class TopicValidator(IdentifierValidatorBase):
         """Clear the validation cache."""
         self._validation_cache.clear()
         logger.info("Topic validation cache cleared")
+
+    def close(self) -> None:
+        """Close the persistent validation cache, if one is open."""
+        if isinstance(self._validation_cache, shelve.Shelf):
+            self._validation_cache.close()
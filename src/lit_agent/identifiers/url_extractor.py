@@ -1,30 +1,48 @@
 """URL extraction and filtering for deepsearch bibliography files."""
 
+import os
+import pickle
 import re
 import logging
-from typing import List, Dict, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from typing import List, Dict, DefaultDict, Set, Tuple, Any, Optional, Union
 from pathlib import Path
 from dataclasses import dataclass
 
-logger = logging.getLogger(__name__)
-
-
-@dataclass
-class URLClassification:
-    """Classification of a URL as academic or non-academic."""
+from .base import _DATACLASS_SLOTS
 
-    url: str
-    is_academic: bool
-    domain: str
-    source_file: str
-    citation_number: str
-
-
-class DeepsearchURLExtractor:
-    """Extract and classify URLs from deepsearch bibliography files."""
+logger = logging.getLogger(__name__)
 
-    # Academic domains that typically contain research papers
-    ACADEMIC_DOMAINS = {
+# Pattern to match bibliography citations with URLs, applied to raw file bytes;
+# the third group is the URL's domain (everything up to the first slash)
+_CITATION_PATTERN = re.compile(rb"\[(\d+)\]\((https://(?=[^\)])([^/\)]*)[^\)]*)\)")
+
+# File name of the extract_deepsearch_urls result cache inside a cache directory
+_URL_CACHE_FILENAME = "deepsearch_urls.pickle"
+
+# URL substrings suggesting an unknown domain hosts academic content
+_ACADEMIC_INDICATORS = (
+    "journal",
+    "article",
+    "paper",
+    "doi",
+    "pmid",
+    "pmc",
+    "research",
+    "study",
+    "publication",
+    "biomedcentral",
+    "springer",
+    "elsevier",
+    "wiley",
+    "nature",
+    "science",
+)
+
+# Academic domains that typically contain research papers
+_ACADEMIC_DOMAINS = frozenset(
+    {
         # Primary academic databases
         "pubmed.ncbi.nlm.nih.gov",
         "pmc.ncbi.nlm.nih.gov",
@@ -67,9 +85,11 @@ class DeepsearchURLExtractor:
         "plos.figshare.com",
         "seek.synergy-munich.de",
     }
+)
 
-    # Non-academic domains (databases, wikis, commercial sites, etc.)
-    NON_ACADEMIC_DOMAINS = {
+# Non-academic domains (databases, wikis, commercial sites, etc.)
+_NON_ACADEMIC_DOMAINS = frozenset(
+    {
         "en.wikipedia.org",
         "www.youtube.com",
         "www.abcam.com",
@@ -81,89 +101,126 @@ class DeepsearchURLExtractor:
         "colab.ws",
         "www.riken.jp",
     }
+)
+
+# Combined lookup of listed domains; academic entries take precedence
+_DOMAIN_CLASSIFICATION: Dict[str, bool] = {
+    **dict.fromkeys(_NON_ACADEMIC_DOMAINS, False),
+    **dict.fromkeys(_ACADEMIC_DOMAINS, True),
+}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class URLClassification:
+    """Classification of a URL as academic or non-academic."""
+
+    url: str
+    is_academic: bool
+    domain: str
+    source_file: str
+    citation_number: str
+
+
+class DeepsearchURLExtractor:
+    """Extract and classify URLs from deepsearch bibliography files."""
+
+    # Listed domains, exposed for callers inspecting the classification rules
+    ACADEMIC_DOMAINS = _ACADEMIC_DOMAINS
+    NON_ACADEMIC_DOMAINS = _NON_ACADEMIC_DOMAINS
+    DOMAIN_CLASSIFICATION = _DOMAIN_CLASSIFICATION
 
     def __init__(self):
         """Initialize the URL extractor."""
-        # Pattern to match bibliography citations with URLs
-        self.citation_pattern = re.compile(r"\[(\d+)\]\((https://[^\)]+)\)")
-
-    def extract_urls_from_file(self, file_path: Path) -> List[URLClassification]:
+        # One shared string per domain instead of a fresh slice for every URL,
+        # keyed by the raw bytes captured by the citation pattern
+        self._domain_intern: Dict[bytes, str] = {}
+
+    def extract_urls_from_file(
+        self,
+        file_path: Union[str, "os.PathLike[str]"],
+        seen: Optional[Dict[str, bool]] = None,
+        academic_only: bool = False,
+    ) -> List[URLClassification]:
         """Extract all bibliography URLs from a single deepsearch file.
 
         Args:
             file_path: Path to the markdown file
+            seen: Optional classification of each URL cited so far; URLs
+                already present are skipped rather than returned again
+            academic_only: Whether to return only URLs classified as academic
 
         Returns:
             List of URLClassification objects
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            urls = []
-            matches = self.citation_pattern.findall(content)
-
-            for citation_num, url in matches:
-                domain = self._extract_domain(url)
-                is_academic = self._classify_url(url, domain)
-
-                urls.append(
-                    URLClassification(
-                        url=url,
-                        is_academic=is_academic,
-                        domain=domain,
-                        source_file=file_path.name,
-                        citation_number=citation_num,
-                    )
-                )
-
-            logger.info(f"Extracted {len(urls)} URLs from {file_path.name}")
-            return urls
-
-        except Exception as e:
-            logger.error(f"Failed to extract URLs from {file_path}: {e}")
+        content = self._read_markdown(file_path)
+        if content is None:
             return []
+        urls, _, _ = self._extract_citations(
+            content, os.path.basename(file_path), set(), seen, academic_only
+        )
+        return urls
 
     def extract_urls_from_directory(
-        self, directory_path: Path
+        self,
+        directory_path: Path,
+        deduplicate: bool = False,
+        academic_only: bool = False,
     ) -> Tuple[List[URLClassification], Dict[str, int]]:
         """Extract URLs from all markdown files in a directory.
 
+        Statistics always count every citation, including duplicates and
+        non-academic URLs left out of the returned list.
+
         Args:
             directory_path: Path to directory containing deepsearch files
+            deduplicate: Whether to keep only the first occurrence of each URL
+            academic_only: Whether to return only URLs classified as academic
 
         Returns:
             Tuple of (all_urls, statistics)
         """
         all_urls = []
+        seen: Optional[Dict[str, bool]] = {} if deduplicate else None
+        academic_urls = 0
+        non_academic_urls = 0
+        unique_domains: Set[str] = set()
+
+        # Find all markdown files; scandir avoids building a Path per entry
+        with os.scandir(directory_path) as entries:
+            md_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            ]
+
+        # Read files concurrently; citations are still parsed in file order so
+        # deduplication keeps the first occurrence across files
+        with ThreadPoolExecutor() as executor:
+            contents = executor.map(self._read_markdown, md_files)
+            for file_path, content in zip(md_files, contents):
+                if content is None:
+                    continue
+                urls, academic, non_academic = self._extract_citations(
+                    content,
+                    os.path.basename(file_path),
+                    unique_domains,
+                    seen,
+                    academic_only,
+                )
+                all_urls.extend(urls)
+                academic_urls += academic
+                non_academic_urls += non_academic
+
         stats: Dict[str, Any] = {
-            "total_files": 0,
-            "total_urls": 0,
-            "academic_urls": 0,
-            "non_academic_urls": 0,
-            "unique_domains": set(),
-            "files_processed": [],
+            "total_files": len(md_files),
+            "total_urls": academic_urls + non_academic_urls,
+            "academic_urls": academic_urls,
+            "non_academic_urls": non_academic_urls,
+            "unique_domains": len(unique_domains),
         }
-
-        # Find all markdown files
-        md_files = list(directory_path.glob("*.md"))
-        stats["total_files"] = len(md_files)
-
-        for file_path in md_files:
-            urls = self.extract_urls_from_file(file_path)
-            all_urls.extend(urls)
-            stats["files_processed"].append(file_path.name)
-
-            # Update statistics
-            for url_class in urls:
-                stats["unique_domains"].add(url_class.domain)
-                if url_class.is_academic:
-                    stats["academic_urls"] += 1
-                else:
-                    stats["non_academic_urls"] += 1
-
-        stats["total_urls"] = len(all_urls)
-        stats["unique_domains"] = len(stats["unique_domains"])
+        if seen is not None:
+            stats["duplicates_removed"] = stats["total_urls"] - len(seen)
+            logger.info(f"Removed {stats['duplicates_removed']} duplicate URLs")
 
         logger.info(
             f"Extracted {stats['total_urls']} total URLs from {stats['total_files']} files"
@@ -224,26 +281,108 @@ class DeepsearchURLExtractor:
         Returns:
             Dictionary mapping domains to lists of URLs
         """
-        domain_breakdown: Dict[str, List[str]] = {}
+        domain_breakdown: DefaultDict[str, List[str]] = defaultdict(list)
         for url_class in url_classifications:
-            domain = url_class.domain
-            if domain not in domain_breakdown:
-                domain_breakdown[domain] = []
-            domain_breakdown[domain].append(url_class.url)
+            domain_breakdown[url_class.domain].append(url_class.url)
+
+        return dict(domain_breakdown)
+
+    def _read_markdown(
+        self, file_path: Union[str, "os.PathLike[str]"]
+    ) -> Optional[bytes]:
+        """Read a deepsearch file, logging and returning None on failure.
+
+        The file is kept as bytes; only the cited URLs are ever decoded.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                return f.read()
+        except Exception as e:
+            logger.error(f"Failed to extract URLs from {file_path}: {e}")
+            return None
+
+    def _extract_citations(
+        self,
+        content: bytes,
+        source_file: str,
+        unique_domains: Set[str],
+        seen: Optional[Dict[str, bool]] = None,
+        academic_only: bool = False,
+    ) -> Tuple[List[URLClassification], int, int]:
+        """Extract and classify the bibliography URLs cited in file content.
 
-        return domain_breakdown
+        Args:
+            content: Raw UTF-8 bytes of the markdown file
+            source_file: Name of the file the content was read from
+            unique_domains: Set collecting the domain of every new URL
+            seen: Optional classification of each URL cited so far
+            academic_only: Whether to return only URLs classified as academic
+
+        Returns:
+            Tuple of (urls, academic_count, non_academic_count), where the
+            counts include duplicates and URLs left out of the list
+        """
+        urls: List[URLClassification] = []
+        academic_count = 0
+        non_academic_count = 0
+
+        # Bind loop invariants once; this loop runs for every citation
+        classify_url = self._classify_url
+        append = urls.append
+        domain_intern = self._domain_intern
+
+        for match in _CITATION_PATTERN.finditer(content):
+            raw_num, raw_url, raw_domain = match.groups()
+            url = raw_url.decode("utf-8", errors="replace")
+
+            # Repeat citations reuse the first classification and are only counted
+            if seen is not None and url in seen:
+                if seen[url]:
+                    academic_count += 1
+                else:
+                    non_academic_count += 1
+                continue
+
+            domain = domain_intern.get(raw_domain)
+            if domain is None:
+                domain = raw_domain.decode("utf-8", errors="replace")
+                domain_intern[raw_domain] = domain
+            is_academic = classify_url(url, domain)
+            if seen is not None:
+                seen[url] = is_academic
+            unique_domains.add(domain)
+
+            if is_academic:
+                academic_count += 1
+            else:
+                non_academic_count += 1
+                if academic_only:
+                    continue
+
+            append(
+                URLClassification(
+                    url=url,
+                    is_academic=is_academic,
+                    domain=domain,
+                    source_file=source_file,
+                    citation_number=raw_num.decode("ascii"),
+                )
+            )
+
+        logger.info(f"Extracted {len(urls)} URLs from {source_file}")
+        return urls, academic_count, non_academic_count
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        # Simple domain extraction
-        try:
-            # Remove protocol
-            domain_part = url.replace("https://", "").replace("http://", "")
-            # Get domain (before first slash)
-            domain = domain_part.split("/")[0]
-            return domain
-        except Exception:
-            return "unknown"
+        # Skip the protocol and take everything up to the first slash
+        if url.startswith("https://"):
+            start = 8
+        elif url.startswith("http://"):
+            start = 7
+        else:
+            start = 0
+        end = url.find("/", start)
+        return url[start:end] if end != -1 else url[start:]
 
     def _classify_url(self, url: str, domain: str) -> bool:
         """Classify URL as academic or non-academic.
@@ -255,35 +394,14 @@ class DeepsearchURLExtractor:
         Returns:
             True if academic, False otherwise
         """
-        # Check explicit academic domains
-        if domain in self.ACADEMIC_DOMAINS:
-            return True
-
-        # Check explicit non-academic domains
-        if domain in self.NON_ACADEMIC_DOMAINS:
-            return False
+        # Check explicitly listed academic and non-academic domains
+        listed = _DOMAIN_CLASSIFICATION.get(domain)
+        if listed is not None:
+            return listed
 
         # Heuristic-based classification for unknown domains
-        academic_indicators = [
-            "journal",
-            "article",
-            "paper",
-            "doi",
-            "pmid",
-            "pmc",
-            "research",
-            "study",
-            "publication",
-            "biomedcentral",
-            "springer",
-            "elsevier",
-            "wiley",
-            "nature",
-            "science",
-        ]
-
         url_lower = url.lower()
-        for indicator in academic_indicators:
+        for indicator in _ACADEMIC_INDICATORS:
             if indicator in url_lower:
                 logger.debug(
                     f"Classified {domain} as academic based on indicator: {indicator}"
@@ -295,13 +413,27 @@ class DeepsearchURLExtractor:
         return False
 
 
+def _directory_fingerprint(directory: Path) -> Tuple[str, int, int]:
+    """Identify a directory's markdown files by path, newest mtime and count."""
+    with os.scandir(directory) as entries:
+        mtimes = [
+            entry.stat().st_mtime_ns
+            for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
+        ]
+    return str(directory.resolve()), max(mtimes, default=0), len(mtimes)
+
+
 def extract_deepsearch_urls(
     directory_path: str = "resources/test_input",
+    cache_dir: Optional[str] = None,
 ) -> Tuple[List[str], Dict[str, int]]:
     """Convenience function to extract academic URLs from deepsearch files.
 
     Args:
         directory_path: Path to directory containing deepsearch files
+        cache_dir: Optional directory for caching results between runs; the
+            cache is reused until the markdown files in the directory change
 
     Returns:
         Tuple of (academic_urls, statistics)
@@ -312,19 +444,34 @@ def extract_deepsearch_urls(
     if not directory.exists():
         raise FileNotFoundError(f"Directory not found: {directory_path}")
 
-    # Extract all URLs
-    all_urls, stats = extractor.extract_urls_from_directory(directory)
-
-    # Remove duplicates
-    unique_urls = extractor.remove_duplicates(all_urls)
+    cache_file = Path(cache_dir) / _URL_CACHE_FILENAME if cache_dir else None
+    if cache_file is not None:
+        fingerprint = _directory_fingerprint(directory)
+        try:
+            with open(cache_file, "rb") as f:
+                cached_fingerprint, cached_result = pickle.load(f)
+            if cached_fingerprint == fingerprint:
+                logger.info(f"Loaded cached deepsearch URLs from {cache_file}")
+                return cached_result
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable URL cache {cache_file}: {e}")
 
-    # Get only academic URLs
-    academic_urls = extractor.get_academic_urls_only(unique_urls)
+    # Extract academic URLs, dropping duplicates as they are found
+    academic, stats = extractor.extract_urls_from_directory(
+        directory, deduplicate=True, academic_only=True
+    )
+    academic_urls = [url_class.url for url_class in academic]
 
     # Update statistics
-    stats["unique_total_urls"] = len(unique_urls)
+    stats["unique_total_urls"] = stats["total_urls"] - stats["duplicates_removed"]
     stats["unique_academic_urls"] = len(academic_urls)
-    stats["duplicates_removed"] = stats["total_urls"] - len(unique_urls)
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump((fingerprint, (academic_urls, stats)), f)
 
     return academic_urls, stats
 
@@ -19,6 +19,7 @@ def run_validation_assessment_demo(
     report_name: Optional[str] = None,
     use_deepsearch_urls: bool = True,
     sample_size: Optional[int] = None,
+    url_cache_dir: Optional[str] = None,
 ) -> dict:
     """Run a complete validation assessment demo with reporting.
 
@@ -36,6 +37,9 @@ def run_validation_assessment_demo(
         report_name: Custom name for the report
         use_deepsearch_urls: Whether to use URLs from deepsearch files (default: True)
         sample_size: Number of URLs to sample for testing (default: None for all)
+        url_cache_dir: Directory for caching extracted deepsearch URLs between
+            runs; kept separate from output_dir as the cache is a pickle
+            (default: None for no caching)
 
     Returns:
         Dictionary containing the complete validation report
@@ -51,7 +55,7 @@ def run_validation_assessment_demo(
         if use_deepsearch_urls:
             try:
                 logger.info("🔍 Extracting URLs from deepsearch bibliography files...")
-                all_urls, url_stats = extract_deepsearch_urls()
+                all_urls, url_stats = extract_deepsearch_urls(cache_dir=url_cache_dir)
 
                 # Sample URLs if requested
                 if sample_size and sample_size < len(all_urls):
@@ -383,6 +387,7 @@ if __name__ == "__main__":
             use_deepsearch_urls=True,  # Use URLs from deepsearch files
             sample_size=100,  # Use 100 URL sample for cost-effective validation
             output_dir="validation_workspace/demo_reports",
+            url_cache_dir="validation_workspace/.cache",
         )
         print("\n🎉 Demo completed successfully!")
         print(
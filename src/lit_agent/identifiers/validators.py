@@ -1,30 +1,211 @@
 """Identifier validation using format checking and API validation."""
 
 import logging
+import os
 import re
+import shelve
+import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
 
 import requests  # type: ignore[import-untyped]
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from urllib3.util.retry import Retry
 
+from ._json import _parse_json
 from .base import IdentifierType, IdentifierValidatorBase
 
+try:
+    from lxml import etree
+except ImportError:  # Fall back to the standard library parser
+    from xml.etree import ElementTree as etree  # type: ignore[no-redef]
+
+# lxml can filter iterparse events by tag in C; ElementTree reports every
+# element and they are filtered in Python instead
+_ARTICLE_ITERPARSE_OPTIONS: Dict[str, Any] = (
+    {"tag": "PubmedArticle"} if hasattr(etree, "LXML_VERSION") else {}
+)
+
 logger = logging.getLogger(__name__)
 
+# Load environment variables (NCBI_EMAIL, NCBI_API_KEY) once for all validators
+load_dotenv()
 
-class FormatValidator(IdentifierValidatorBase):
-    """Validates identifiers based on format rules."""
 
-    def __init__(self):
-        """Initialize format patterns."""
-        # PMID: 1-8 digits, no leading zeros
-        self.pmid_pattern = re.compile(r"^\d{1,8}$")
+class _TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers that find the bucket empty reserve their tokens and sleep outside
+    the lock, so concurrent callers queue up in order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: int = 1) -> None:
+        """Take ``n`` tokens, sleeping until they are available.
+
+        Args:
+            n: Number of tokens to take
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+# Requests per second NCBI E-utilities allow without and with an API key
+_NCBI_REQUESTS_PER_SECOND = 3.0
+_NCBI_KEYED_REQUESTS_PER_SECOND = 10.0
+
+
+@lru_cache(maxsize=None)
+def _ncbi_limiter(api_key: Optional[str]) -> _TokenBucket:
+    """Return the rate limiter shared by every validator using an API key.
+
+    NCBI limits requests per key (or per client without one), so validators
+    with the same key share a bucket and together stay within the limit.
+    """
+    rate = _NCBI_KEYED_REQUESTS_PER_SECOND if api_key else _NCBI_REQUESTS_PER_SECOND
+    return _TokenBucket(rate=rate, capacity=rate)
+
+
+# Seconds NCBI answers stay cached; answers that an identifier does not exist
+# expire sooner as new records are added to PubMed daily
+_CACHE_TTL = 30 * 86400
+_MISS_CACHE_TTL = 86400
+
+# NCBI answers kept in memory per validator when no cache directory is given;
+# the least recently used are dropped beyond this
+_MEMORY_CACHE_SIZE = 10000
+
+# Identifiers whose confirmed composite scores are remembered per validator
+_COMPOSITE_CACHE_SIZE = 65536
+
+# Lowest child score that confirms an identifier (metapub 0.95, NCBI 0.98);
+# only confirmations are remembered so that fallback scores given during an
+# outage are not kept
+_CONFIRMED_SCORE = 0.95
+
+# Identifiers whose metapub lookups are remembered per validator
+_METAPUB_CACHE_SIZE = 4096
+
+# Returned by the response cache lookup when nothing usable is cached
+_CACHE_MISS = object()
+
+# Maximum identifiers per NCBI ID Converter request
+_IDCONV_BATCH_SIZE = 200
+
+# Maximum PMIDs per efetch request
+_EFETCH_BATCH_SIZE = 200
+
+# ID Converter record field holding each identifier type
+_IDCONV_FIELDS = {
+    IdentifierType.PMID: "pmid",
+    IdentifierType.PMC: "pmcid",
+    IdentifierType.DOI: "doi",
+}
+
+# Distinct values remembered by each format check; identifiers repeat heavily
+# across a corpus and every validator re-checks the format
+_FORMAT_CACHE_SIZE = 131072
 
-        # PMC: PMC followed by digits
-        self.pmc_pattern = re.compile(r"^PMC\d+$")
+# PMID: 1-8 digits, no leading zeros, so 1..99999999 (current max is ~39M)
+_PMID_PATTERN = re.compile(r"^[1-9]\d{0,7}$", re.ASCII)
 
-        # DOI: 10.{registrant}/{suffix}
-        self.doi_pattern = re.compile(r"^10\.\d{4,}/[^\s]+$")
+# PMC: PMC followed by a number in 1..99999999, leading zeros allowed
+_PMC_PATTERN = re.compile(r"^PMC0*[1-9]\d{0,7}$", re.ASCII)
+
+# DOI: 10.{registrant}/{suffix}, registrant of at least 4 digits
+_DOI_PATTERN = re.compile(r"^10\.\d{4,}/[^\s]+$")
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _is_valid_pmid(pmid: str) -> bool:
+    """Check a stripped PMID against the format rules."""
+    return _PMID_PATTERN.match(pmid) is not None
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _is_valid_pmc(pmc: str) -> bool:
+    """Check a stripped PMC ID against the format rules."""
+    return _PMC_PATTERN.match(pmc) is not None
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _is_valid_doi(doi: str) -> bool:
+    """Check a stripped DOI against the format rules.
+
+    The pattern already guarantees a numeric registrant of at least four
+    digits and a non-empty suffix without whitespace.
+    """
+    return _DOI_PATTERN.match(doi) is not None
+
+
+# All three formats in one pattern, for values of unknown type; the digit
+# classes match the ASCII-only PMID and PMC patterns above
+_ANY_IDENTIFIER_PATTERN = re.compile(
+    r"^(?:(?P<pmid>[1-9][0-9]{0,7})"
+    r"|(?P<pmc>PMC0*[1-9][0-9]{0,7})"
+    r"|(?P<doi>10\.\d{4,}/[^\s]+))$"
+)
+
+# Identifier type for each named group of the combined pattern
+_IDENTIFIER_GROUPS = {
+    "pmid": IdentifierType.PMID,
+    "pmc": IdentifierType.PMC,
+    "doi": IdentifierType.DOI,
+}
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _detect_identifier_type(value: str) -> Optional[IdentifierType]:
+    """Return the type whose format a stripped value matches, if any."""
+    match = _ANY_IDENTIFIER_PATTERN.match(value)
+    return _IDENTIFIER_GROUPS[match.lastgroup] if match else None
+
+
+# Format check for each identifier type
+_FORMAT_CHECKS: Dict[IdentifierType, Callable[[str], bool]] = {
+    IdentifierType.PMID: _is_valid_pmid,
+    IdentifierType.PMC: _is_valid_pmc,
+    IdentifierType.DOI: _is_valid_doi,
+}
+
+
+class FormatValidator(IdentifierValidatorBase):
+    """Validates identifiers based on format rules."""
 
     def validate_identifier(self, identifier_type: IdentifierType, value: str) -> bool:
         """Validate identifier format.
@@ -39,93 +220,175 @@ class FormatValidator(IdentifierValidatorBase):
         if not value or not isinstance(value, str):
             return False
 
-        value = value.strip()
+        check = _FORMAT_CHECKS.get(identifier_type)
+        return check is not None and check(value.strip())
 
-        if identifier_type == IdentifierType.PMID:
-            return self._validate_pmid_format(value)
-        elif identifier_type == IdentifierType.PMC:
-            return self._validate_pmc_format(value)
-        elif identifier_type == IdentifierType.DOI:
-            return self._validate_doi_format(value)
+    def detect_and_validate(self, value: str) -> Optional[IdentifierType]:
+        """Identify which identifier format a value is valid for.
 
-        return False
+        One combined regex match replaces validating against each type in
+        turn.
 
-    def _validate_pmid_format(self, pmid: str) -> bool:
-        """Validate PMID format."""
-        if not self.pmid_pattern.match(pmid):
-            return False
+        Args:
+            value: Identifier value of unknown type
 
-        # Check for leading zeros (invalid)
-        if len(pmid) > 1 and pmid.startswith("0"):
-            return False
+        Returns:
+            The identifier type, or None if the value matches no format
+        """
+        if not value or not isinstance(value, str):
+            return None
 
-        # Check reasonable range (first PMID was 1)
-        try:
-            pmid_int = int(pmid)
-            return 1 <= pmid_int <= 99999999  # Current max is around 39M
-        except ValueError:
-            return False
+        return _detect_identifier_type(value.strip())
+
+    def validate_many(
+        self, identifier_type: IdentifierType, values: Iterable[str]
+    ) -> Dict[str, bool]:
+        """Validate the format of several identifiers of one type.
+
+        The check for the type is looked up once for the whole list.
+
+        Args:
+            identifier_type: Type of the identifiers
+            values: Identifier values to validate
+
+        Returns:
+            Dictionary mapping each value to whether its format is valid
+        """
+        check = _FORMAT_CHECKS.get(identifier_type)
+        if check is None:
+            return {value: False for value in values}
+        return {
+            value: bool(value) and isinstance(value, str) and check(value.strip())
+            for value in values
+        }
+
+    def _validate_pmid_format(self, pmid: str) -> bool:
+        """Validate PMID format."""
+        return _is_valid_pmid(pmid)
 
     def _validate_pmc_format(self, pmc: str) -> bool:
         """Validate PMC format."""
-        if not self.pmc_pattern.match(pmc):
-            return False
-
-        # Extract numeric part and validate
-        try:
-            numeric_part = pmc[3:]  # Remove 'PMC'
-            pmc_int = int(numeric_part)
-            return 1 <= pmc_int <= 99999999  # Reasonable range
-        except ValueError:
-            return False
+        return _is_valid_pmc(pmc)
 
     def _validate_doi_format(self, doi: str) -> bool:
         """Validate DOI format."""
-        if not self.doi_pattern.match(doi):
-            return False
+        return _is_valid_doi(doi)
 
-        # Additional checks
-        parts = doi.split("/", 1)
-        if len(parts) != 2:
-            return False
 
-        registrant, suffix = parts
-        registrant_digits = registrant[3:]  # Remove '10.'
+# Format validator used by the other validators unless one is passed in; it
+# holds no state, so a single instance is safely shared
+_DEFAULT_FORMAT_VALIDATOR = FormatValidator()
 
-        # Registrant should be at least 4 digits
-        if not registrant_digits.isdigit() or len(registrant_digits) < 4:
-            return False
 
-        # Suffix should not be empty and should contain valid characters
-        if not suffix or len(suffix.strip()) == 0:
-            return False
+def _iter_pubmed_articles(source: Any) -> Iterator[Any]:
+    """Yield each PubmedArticle element of an efetch XML stream.
+
+    Each article is cleared once the consumer moves on, so memory is bounded
+    by one article rather than the whole response.
+
+    Args:
+        source: Binary file-like object with the efetch XML
+
+    Yields:
+        PubmedArticle elements in document order
+    """
+    for _, elem in etree.iterparse(
+        source, events=("end",), **_ARTICLE_ITERPARSE_OPTIONS
+    ):
+        if elem.tag == "PubmedArticle":
+            yield elem
+            elem.clear()
+
 
-        return True
+def _extract_metadata(article: Any, pmid: str) -> Dict[str, Any]:
+    """Extract title, abstract, authors, journal and year from an article.
+
+    Args:
+        article: PubmedArticle element
+        pmid: PubMed ID for the article
+
+    Returns:
+        Dictionary with the metadata found
+    """
+    metadata: Dict[str, Any] = {"pmid": pmid}
+
+    # Extract title
+    title_elem = article.find(".//ArticleTitle")
+    if title_elem is not None:
+        metadata["title"] = title_elem.text or ""
+
+    # Extract abstract
+    abstract_elem = article.find(".//AbstractText")
+    if abstract_elem is not None:
+        metadata["abstract"] = abstract_elem.text or ""
+
+    # Extract authors
+    authors = []
+    for author in article.findall(".//Author"):
+        last_name = author.find("LastName")
+        fore_name = author.find("ForeName")
+        if last_name is not None:
+            author_name = last_name.text or ""
+            if fore_name is not None and fore_name.text:
+                author_name = f"{fore_name.text} {author_name}"
+            authors.append(author_name)
+
+    if authors:
+        metadata["authors"] = authors
+
+    # Extract journal information
+    journal_elem = article.find(".//Journal/Title")
+    if journal_elem is not None:
+        metadata["journal"] = journal_elem.text or ""
+
+    # Extract publication year
+    year_elem = article.find(".//PubDate/Year")
+    if year_elem is not None:
+        metadata["year"] = year_elem.text or ""
+
+    return metadata
 
 
 class NCBIAPIValidator(IdentifierValidatorBase):
     """Validates identifiers using NCBI API."""
 
     def __init__(
-        self, timeout: int = 10, rate_limit: float = 0.5, email: Optional[str] = None
+        self,
+        timeout: int = 10,
+        rate_limit: Optional[float] = None,
+        email: Optional[str] = None,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        format_validator: Optional[FormatValidator] = None,
     ):
         """Initialize API validator.
 
         Args:
             timeout: Request timeout in seconds
-            rate_limit: Minimum time between requests in seconds
+            rate_limit: Minimum time between requests in seconds; defaults
+                to just under NCBI's limit, 0.34 or 0.11 with an API key
             email: Email address for NCBI API (should be registered with NCBI)
+            api_key: NCBI API key, read from NCBI_API_KEY if omitted; raises
+                the E-utilities limit from 3 to 10 requests per second
+            cache_dir: Optional directory for a persistent cache of NCBI
+                answers shared across runs; answers are kept in memory only
+                if omitted
+            format_validator: Format validator for basic checks; a shared
+                default is used if omitted
         """
         self.timeout = timeout
+        self.api_key = api_key or os.getenv("NCBI_API_KEY")
+        if rate_limit is None:
+            rate_limit = 0.11 if self.api_key else 0.34
         self.rate_limit = rate_limit
-        self.last_request_time = 0.0
+        # Per-instance spacing on top of the limit shared by all validators
+        self._limiter = (
+            _TokenBucket(rate=1.0 / rate_limit, capacity=1) if rate_limit > 0 else None
+        )
+        self._shared_limiter = _ncbi_limiter(self.api_key)
 
         # Use provided email or environment variable, with fallback
         # Note: For production use, email should be registered with NCBI
-        from dotenv import load_dotenv
-        import os
-
-        load_dotenv()
         self.email = email or os.getenv("NCBI_EMAIL", "developer@localhost")
 
         # NCBI API URLs
@@ -134,8 +397,56 @@ class NCBIAPIValidator(IdentifierValidatorBase):
             "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
         )
 
+        # Request parameters that are the same for every call; only the
+        # identifiers are added per request
+        self._idconv_params = {
+            "tool": "lit-agent",
+            "email": self.email,  # Required by NCBI
+            "format": "json",
+        }
+        self._efetch_params = {
+            "db": "pubmed",
+            "retmode": "xml",
+            "rettype": "abstract",
+            "tool": "lit-agent",
+            "email": self.email,
+        }
+        # The key is an E-utilities credential; the PMC ID converter has none
+        if self.api_key:
+            self._efetch_params["api_key"] = self.api_key
+
         # Format validator for basic checks
-        self.format_validator = FormatValidator()
+        self.format_validator = format_validator or _DEFAULT_FORMAT_VALIDATOR
+
+        # Pooled keep-alive session; NCBI 429s and 5xx responses are retried
+        # with backoff and the final response is returned rather than raised.
+        # Connection and read failures still fail fast, as callers fall back
+        # to format validation when the API is unreachable.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+
+        # NCBI answers by identifier, stored with their expiry time
+        self._response_cache: MutableMapping[str, Tuple[float, Any]]
+        if cache_dir:
+            cache_path = Path(cache_dir)
+            cache_path.mkdir(parents=True, exist_ok=True)
+            self._response_cache = shelve.open(str(cache_path / "ncbi_responses"))
+        else:
+            self._response_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def validate_identifier(self, identifier_type: IdentifierType, value: str) -> bool:
         """Validate identifier using NCBI API.
@@ -161,6 +472,49 @@ class NCBIAPIValidator(IdentifierValidatorBase):
             # Fall back to format validation
             return True  # Assume valid if API fails
 
+    def validate_many(
+        self, identifier_type: IdentifierType, values: Iterable[str]
+    ) -> Dict[str, bool]:
+        """Validate several identifiers of one type with batched API requests.
+
+        Well-formed values are sent to the ID converter in groups of up to
+        200 instead of one request each; results follow validate_identifier.
+
+        Args:
+            identifier_type: Type of the identifiers
+            values: Identifier values to validate
+
+        Returns:
+            Dictionary mapping each value to whether it is valid
+        """
+        results = self.format_validator.validate_many(identifier_type, values)
+        pending = []
+        get_cached = self._get_cached
+        key_prefix = f"idconv:{identifier_type.value}:"
+        for value, is_well_formed in results.items():
+            if not is_well_formed:
+                continue
+            cached = get_cached(key_prefix + value)
+            if cached is _CACHE_MISS:
+                pending.append(value)
+            else:
+                results[value] = cached is not None
+
+        for start in range(0, len(pending), _IDCONV_BATCH_SIZE):
+            batch = pending[start : start + _IDCONV_BATCH_SIZE]
+            try:
+                records = self._query_ncbi_api_batch(identifier_type, batch)
+            except Exception as e:
+                logger.warning(
+                    f"API validation failed for {len(batch)} "
+                    f"{identifier_type.value} identifiers: {e}"
+                )
+                continue  # Assume valid if API fails
+            for value in batch:
+                results[value] = records.get(value.lower()) is not None
+
+        return results
+
     def get_confidence_score(
         self, identifier_type: IdentifierType, value: str
     ) -> float:
@@ -243,6 +597,44 @@ class NCBIAPIValidator(IdentifierValidatorBase):
         except Exception:
             return None
 
+    def get_article_metadata_many(
+        self, pmids: Iterable[str]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Fetch article metadata for several PMIDs with batched efetch requests.
+
+        Up to 200 PMIDs are fetched per request and their articles are parsed
+        as the response streams in. Results are yielded as they become
+        available, so not necessarily in input order.
+
+        Args:
+            pmids: PubMed IDs
+
+        Yields:
+            (pmid, metadata) for each distinct PMID; metadata is None if the
+            PMID is malformed, not found or could not be fetched
+        """
+        pending = []
+        seen = set()
+        is_valid_pmid = self.format_validator.validate_identifier
+        get_cached = self._get_cached
+        for pmid in pmids:
+            if pmid in seen:
+                continue
+            seen.add(pmid)
+            if not is_valid_pmid(IdentifierType.PMID, pmid):
+                yield pmid, None
+                continue
+            cached = get_cached(f"efetch:{pmid}")
+            if cached is _CACHE_MISS:
+                pending.append(pmid)
+            else:
+                yield pmid, cached
+
+        for start in range(0, len(pending), _EFETCH_BATCH_SIZE):
+            yield from self._fetch_metadata_batch(
+                pending[start : start + _EFETCH_BATCH_SIZE]
+            )
+
     def _fetch_article_metadata(self, pmid: str) -> Optional[Dict[str, Any]]:
         """Fetch article metadata using efetch API.
 
@@ -252,39 +644,76 @@ class NCBIAPIValidator(IdentifierValidatorBase):
         Returns:
             Dictionary with title, abstract, authors, etc.
         """
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit:
-            time.sleep(self.rate_limit - time_since_last)
+        return dict(self.get_article_metadata_many([pmid])).get(pmid)
+
+    def _fetch_metadata_batch(
+        self, pmids: List[str]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Fetch and stream article metadata for PMIDs in one efetch request.
+
+        Args:
+            pmids: PubMed IDs, at most 200
+
+        Yields:
+            (pmid, metadata) for each PMID; metadata is None if it is not
+            found or could not be fetched
+        """
+        self._wait_for_rate_limit()
+
+        described = f"PMID {pmids[0]}" if len(pmids) == 1 else f"{len(pmids)} PMIDs"
 
         # Prepare efetch API request
-        params = {
-            "db": "pubmed",
-            "id": pmid,
-            "retmode": "xml",
-            "rettype": "abstract",
-            "tool": "lit-agent",
-            "email": self.email,
-        }
+        params = {**self._efetch_params, "id": ",".join(pmids)}
 
         try:
-            response = requests.get(
-                self.efetch_base_url, params=params, timeout=self.timeout
+            response = self._session.get(
+                self.efetch_base_url, params=params, timeout=self.timeout, stream=True
             )
-            self.last_request_time = time.time()
+        except requests.RequestException as e:
+            logger.warning(f"efetch API request failed for {described}: {e}")
+            for pmid in pmids:
+                yield pmid, None
+            return
 
-            if response.status_code == 200:
-                return self._parse_efetch_xml(response.text, pmid)
-            else:
+        remaining = set(pmids)
+        try:
+            if response.status_code != 200:
                 logger.warning(
-                    f"efetch API returned status {response.status_code} for PMID {pmid}"
+                    f"efetch API returned status {response.status_code} for {described}"
                 )
-                return None
+            else:
+                # Parse articles as the body arrives; the whole body is read
+                # so the connection goes back to the pool
+                response.raw.decode_content = True
+                for article in _iter_pubmed_articles(response.raw):
+                    # A single requested PMID takes the first article as-is
+                    pmid = (
+                        pmids[0]
+                        if len(pmids) == 1
+                        else article.findtext("MedlineCitation/PMID")
+                    )
+                    if pmid not in remaining:
+                        continue
+                    remaining.discard(pmid)
+                    metadata = _extract_metadata(article, pmid)
+                    self._store_cached(f"efetch:{pmid}", metadata, sync=False)
+                    yield pmid, metadata
+
+                # The whole response was read, so the rest were not found
+                for pmid in remaining:
+                    self._store_cached(f"efetch:{pmid}", None, sync=False)
+
+        except etree.ParseError as e:
+            logger.warning(f"Failed to parse XML for {described}: {e}")
+        except Exception as e:
+            logger.warning(f"efetch API request failed for {described}: {e}")
+        finally:
+            response.close()
+            self._sync_cache()
 
-        except requests.RequestException as e:
-            logger.warning(f"efetch API request failed for PMID {pmid}: {e}")
-            return None
+        for pmid in pmids:
+            if pmid in remaining:
+                yield pmid, None
 
     def _parse_efetch_xml(
         self, xml_content: str, pmid: str
@@ -299,60 +728,120 @@ class NCBIAPIValidator(IdentifierValidatorBase):
             Dictionary with parsed metadata
         """
         try:
-            from xml.etree import ElementTree as ET
-
-            root = ET.fromstring(xml_content)
+            root = etree.fromstring(xml_content.encode("utf-8"))
 
             # Find the PubmedArticle element
             article = root.find(".//PubmedArticle")
             if article is None:
                 return None
 
-            metadata: Dict[str, Any] = {"pmid": pmid}
-
-            # Extract title
-            title_elem = article.find(".//ArticleTitle")
-            if title_elem is not None:
-                metadata["title"] = title_elem.text or ""
-
-            # Extract abstract
-            abstract_elem = article.find(".//AbstractText")
-            if abstract_elem is not None:
-                metadata["abstract"] = abstract_elem.text or ""
-
-            # Extract authors
-            authors = []
-            for author in article.findall(".//Author"):
-                last_name = author.find("LastName")
-                fore_name = author.find("ForeName")
-                if last_name is not None:
-                    author_name = last_name.text or ""
-                    if fore_name is not None and fore_name.text:
-                        author_name = f"{fore_name.text} {author_name}"
-                    authors.append(author_name)
-
-            if authors:
-                metadata["authors"] = authors
-
-            # Extract journal information
-            journal_elem = article.find(".//Journal/Title")
-            if journal_elem is not None:
-                metadata["journal"] = journal_elem.text or ""
-
-            # Extract publication year
-            year_elem = article.find(".//PubDate/Year")
-            if year_elem is not None:
-                metadata["year"] = year_elem.text or ""
-
-            return metadata
-
-        except ET.ParseError as e:
+            return _extract_metadata(article, pmid)
+
+        except etree.ParseError as e:
             logger.warning(f"Failed to parse XML for PMID {pmid}: {e}")
             return None
         except Exception as e:
             logger.warning(f"Unexpected error parsing metadata for PMID {pmid}: {e}")
             return None
 
+    def _query_ncbi_api_batch(
+        self, identifier_type: IdentifierType, values: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Query NCBI ID Converter API for several identifiers at once.
+
+        Args:
+            identifier_type: Type of the identifiers
+            values: Identifier values, at most 200
+
+        Returns:
+            API records keyed by the lowercased identifier they answer; empty
+            if the API returned an error status. Each value's answer is also
+            cached.
+        """
+        self._wait_for_rate_limit()
+
+        params = {**self._idconv_params, "ids": ",".join(values)}
+
+        try:
+            response = self._session.get(
+                self.api_base_url, params=params, timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            logger.warning(f"NCBI API request failed: {e}")
+            raise
+
+        if response.status_code != 200:
+            logger.warning(f"NCBI API returned status {response.status_code}")
+            return {}
+
+        # Match records back to the requested values; NCBI echoes each one as
+        # "requested-id", else fall back to the field for this identifier type
+        id_field = _IDCONV_FIELDS[identifier_type]
+        records = {}
+        for record in _parse_json(response.content).get("records") or []:
+            requested = record.get("requested-id") or record.get(id_field)
+            if requested:
+                records[str(requested).lower()] = record
+        store_cached = self._store_cached
+        key_prefix = f"idconv:{identifier_type.value}:"
+        for value in values:
+            store_cached(key_prefix + value, records.get(value.lower()), sync=False)
+        self._sync_cache()
+        return records
+
+    def _get_cached(self, cache_key: str) -> Any:
+        """Return a cached NCBI answer, or _CACHE_MISS if absent or expired."""
+        with self._cache_lock:
+            entry = self._response_cache.get(cache_key)
+            if entry is None or entry[0] < time.time():
+                return _CACHE_MISS
+            if isinstance(self._response_cache, OrderedDict):
+                self._response_cache.move_to_end(cache_key)
+            return entry[1]
+
+    def _store_cached(self, cache_key: str, answer: Any, sync: bool = True) -> None:
+        """Cache an NCBI answer.
+
+        Args:
+            cache_key: Cache key for the request
+            answer: Answer to cache; None records that nothing was found
+            sync: Whether to flush a persistent cache to disk now; batches
+                pass False and sync once at the end
+        """
+        ttl = _CACHE_TTL if answer is not None else _MISS_CACHE_TTL
+        with self._cache_lock:
+            self._response_cache[cache_key] = (time.time() + ttl, answer)
+            if isinstance(self._response_cache, OrderedDict):
+                self._response_cache.move_to_end(cache_key)
+                if len(self._response_cache) > _MEMORY_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+        if sync:
+            self._sync_cache()
+
+    def _sync_cache(self) -> None:
+        """Flush a persistent response cache to disk."""
+        if isinstance(self._response_cache, shelve.Shelf):
+            with self._cache_lock:
+                self._response_cache.sync()
+
+    def clear_cache(self) -> None:
+        """Clear the NCBI response cache."""
+        with self._cache_lock:
+            self._response_cache.clear()
+        logger.info("NCBI response cache cleared")
+
+    def close(self) -> None:
+        """Close the persistent response cache, if one is open."""
+        if isinstance(self._response_cache, shelve.Shelf):
+            with self._cache_lock:
+                self._response_cache.close()
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until both this instance and the shared NCBI limit allow."""
+        if self._limiter is not None:
+            self._limiter.acquire()
+        self._shared_limiter.acquire()
+
     def _query_ncbi_api(
         self, identifier_type: IdentifierType, value: str
     ) -> Optional[Dict[str, Any]]:
@@ -365,32 +854,27 @@ class NCBIAPIValidator(IdentifierValidatorBase):
         Returns:
             API response data or None if not found
         """
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit:
-            time.sleep(self.rate_limit - time_since_last)
+        cache_key = f"idconv:{identifier_type.value}:{value}"
+        cached = self._get_cached(cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+        self._wait_for_rate_limit()
 
         # Prepare API request
-        params = {
-            "tool": "lit-agent",
-            "email": self.email,  # Required by NCBI
-            "ids": value,
-            "format": "json",
-        }
+        params = {**self._idconv_params, "ids": value}
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 self.api_base_url, params=params, timeout=self.timeout
             )
-            self.last_request_time = time.time()
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response.content)
                 # Check if the identifier was found
-                if "records" in data and data["records"]:
-                    return data["records"][0] if data["records"] else None
-                return None
+                record = data["records"][0] if data.get("records") else None
+                self._store_cached(cache_key, record)
+                return record
             else:
                 logger.warning(f"NCBI API returned status {response.status_code}")
                 return None
@@ -400,12 +884,39 @@ class NCBIAPIValidator(IdentifierValidatorBase):
             raise
 
 
+@lru_cache(maxsize=None)
+def _load_metapub() -> Any:
+    """Import metapub once, returning None if it is not installed.
+
+    The import is deferred to first use as it takes over 100 ms.
+    """
+    try:
+        import metapub  # type: ignore[import-untyped]
+        from metapub import pubmedcentral  # type: ignore[import-untyped]  # noqa: F401
+    except ImportError:
+        return None
+    return metapub
+
+
 class MetapubValidator(IdentifierValidatorBase):
     """Validates identifiers using metapub library."""
 
-    def __init__(self):
-        """Initialize metapub validator."""
-        self.format_validator = FormatValidator()
+    def __init__(self, format_validator: Optional[FormatValidator] = None):
+        """Initialize metapub validator.
+
+        Args:
+            format_validator: Format validator for basic checks; a shared
+                default is used if omitted
+        """
+        self.format_validator = format_validator or _DEFAULT_FORMAT_VALIDATOR
+
+        # Fetchers are created on first use and reused for every lookup
+        self._pubmed_fetcher: Any = None
+        self._doi_to_pmid: Optional[Callable[[str], Any]] = None
+
+        # Lookups are remembered per instance so that scoring an identifier
+        # after validating it does not repeat the network round trip
+        self._cached_lookup = lru_cache(maxsize=_METAPUB_CACHE_SIZE)(self._lookup)
 
     def validate_identifier(self, identifier_type: IdentifierType, value: str) -> bool:
         """Validate identifier using metapub.
@@ -421,45 +932,75 @@ class MetapubValidator(IdentifierValidatorBase):
         if not self.format_validator.validate_identifier(identifier_type, value):
             return False
 
-        try:
-            import metapub  # type: ignore[import-untyped]
-
-            if identifier_type == IdentifierType.PMID:
-                # Try to fetch article by PMID
-                article = metapub.PubMedFetcher().article_by_pmid(value)
-                return article is not None
-
-            elif identifier_type == IdentifierType.DOI:
-                # Try to get PMID for DOI using CrossRefFetcher (version-dependent API)
-                fetcher = metapub.CrossRefFetcher()
-
-                pmid = None
-                if hasattr(fetcher, "pmid_from_doi"):
-                    pmid = fetcher.pmid_from_doi(value)
-                elif hasattr(fetcher, "article_by_doi"):
-                    article = fetcher.article_by_doi(value)
-                    pmid = getattr(article, "pmid", None) if article else None
-
-                return pmid is not None
-
-            elif identifier_type == IdentifierType.PMC:
-                # PMC validation through conversion using pubmedcentral module
-                from metapub import pubmedcentral  # type: ignore[import-untyped]
-                # Try to convert PMC to PMID
-                pmid = pubmedcentral.get_pmid_for_otherid(value)
-                return pmid is not None
-
-        except ImportError:
+        metapub = _load_metapub()
+        if metapub is None:
             logger.warning("metapub not available, falling back to format validation")
             return True
+
+        try:
+            return self._cached_lookup(identifier_type, value)
         except Exception as e:
             logger.warning(
                 f"metapub validation failed for {identifier_type.value} {value}: {e}"
             )
             return True  # Assume valid if validation fails
 
+    def _lookup(self, identifier_type: IdentifierType, value: str) -> bool:
+        """Look up a well-formed identifier with metapub.
+
+        Errors propagate so that they are not memoized by ``_cached_lookup``.
+
+        Args:
+            identifier_type: Type of identifier
+            value: Identifier value to look up
+
+        Returns:
+            True if metapub found the identifier, False otherwise
+        """
+        metapub = _load_metapub()
+
+        if identifier_type == IdentifierType.PMID:
+            # Try to fetch article by PMID
+            if self._pubmed_fetcher is None:
+                self._pubmed_fetcher = metapub.PubMedFetcher()
+            article = self._pubmed_fetcher.article_by_pmid(value)
+            return article is not None
+
+        elif identifier_type == IdentifierType.DOI:
+            # Try to get PMID for DOI using CrossRefFetcher
+            if self._doi_to_pmid is None:
+                self._doi_to_pmid = self._resolve_doi_lookup(metapub)
+            return self._doi_to_pmid(value) is not None
+
+        elif identifier_type == IdentifierType.PMC:
+            # PMC validation through conversion using pubmedcentral module
+            pmid = metapub.pubmedcentral.get_pmid_for_otherid(value)
+            return pmid is not None
+
         return False
 
+    @staticmethod
+    def _resolve_doi_lookup(metapub: Any) -> Callable[[str], Any]:
+        """Bind the DOI to PMID lookup offered by this metapub version.
+
+        Args:
+            metapub: The imported metapub module
+
+        Returns:
+            Function mapping a DOI to its PMID, or to None if not found
+        """
+        fetcher = metapub.CrossRefFetcher()
+        if hasattr(fetcher, "pmid_from_doi"):
+            return fetcher.pmid_from_doi
+        if hasattr(fetcher, "article_by_doi"):
+
+            def doi_to_pmid(doi: str) -> Any:
+                article = fetcher.article_by_doi(doi)
+                return getattr(article, "pmid", None) if article else None
+
+            return doi_to_pmid
+        return lambda doi: None
+
     def get_confidence_score(
         self, identifier_type: IdentifierType, value: str
     ) -> float:
@@ -472,49 +1013,76 @@ class MetapubValidator(IdentifierValidatorBase):
 class CompositeValidator(IdentifierValidatorBase):
     """Composite validator that combines multiple validation methods."""
 
-    def __init__(self, use_api: bool = True, use_metapub: bool = True):
+    def __init__(
+        self,
+        use_api: bool = True,
+        use_metapub: bool = True,
+        format_validator: Optional[FormatValidator] = None,
+        early_exit_score: float = 0.95,
+    ):
         """Initialize composite validator.
 
         Args:
             use_api: Whether to use NCBI API validation
             use_metapub: Whether to use metapub validation
+            format_validator: Format validator for basic checks, also passed
+                to the child validators; a shared default is used if omitted
+            early_exit_score: Confidence at which scoring stops without
+                asking the remaining validators; the default is the most
+                metapub can give, so an API confirmation (0.98) ends it
         """
-        self.format_validator = FormatValidator()
-        self.api_validator = NCBIAPIValidator() if use_api else None
-        self.metapub_validator = MetapubValidator() if use_metapub else None
+        self.early_exit_score = early_exit_score
+        self.format_validator = format_validator or _DEFAULT_FORMAT_VALIDATOR
+        self.api_validator = (
+            NCBIAPIValidator(format_validator=self.format_validator)
+            if use_api
+            else None
+        )
+        self.metapub_validator = (
+            MetapubValidator(format_validator=self.format_validator)
+            if use_metapub
+            else None
+        )
+
+        # Confirmed scores are remembered, as the child validators make
+        # network requests; the least recently used are dropped beyond
+        # _COMPOSITE_CACHE_SIZE
+        self._confirmed_scores: "OrderedDict[Tuple[IdentifierType, str], float]" = (
+            OrderedDict()
+        )
+        self._confirmed_lock = threading.Lock()
 
     def validate_identifier(self, identifier_type: IdentifierType, value: str) -> bool:
-        """Validate using multiple methods.
+        """Validate an identifier; the child validators only affect its score.
 
         Args:
             identifier_type: Type of identifier
             value: Identifier value to validate
 
         Returns:
-            True if valid according to any method, False otherwise
+            True if the identifier is well-formed, False otherwise
         """
-        # Format validation (required)
-        if not self.format_validator.validate_identifier(identifier_type, value):
-            return False
+        # A well-formed identifier is valid whatever the API or metapub
+        # report, so no requests are made
+        return self.format_validator.validate_identifier(identifier_type, value)
 
-        # Try additional validators
-        validators = [
-            v for v in [self.api_validator, self.metapub_validator] if v is not None
-        ]
+    def validate_many(
+        self, identifier_type: IdentifierType, values: Iterable[str]
+    ) -> Dict[str, bool]:
+        """Validate several identifiers of one type using multiple methods.
 
-        if not validators:
-            return True  # Only format validation available
+        Gives the same answers as validate_identifier for each value. A
+        well-formed value is valid whatever the API or metapub report, so
+        only the format is checked and no requests are made.
 
-        # If any validator confirms it's valid, consider it valid
-        for validator in validators:
-            try:
-                if validator.validate_identifier(identifier_type, value):
-                    return True
-            except Exception as e:
-                logger.warning(f"Validator {validator.__class__.__name__} failed: {e}")
+        Args:
+            identifier_type: Type of the identifiers
+            values: Identifier values to validate
 
-        # If all validators fail but format is good, assume valid
-        return True
+        Returns:
+            Dictionary mapping each value to whether it is valid
+        """
+        return self.format_validator.validate_many(identifier_type, values)
 
     def get_confidence_score(
         self, identifier_type: IdentifierType, value: str
@@ -524,6 +1092,25 @@ class CompositeValidator(IdentifierValidatorBase):
         if not self.format_validator.validate_identifier(identifier_type, value):
             return 0.0
 
+        key = (identifier_type, value)
+        with self._confirmed_lock:
+            score = self._confirmed_scores.get(key)
+            if score is not None:
+                self._confirmed_scores.move_to_end(key)
+                return score
+
+        score = self._confidence_well_formed(identifier_type, value)
+        if score >= _CONFIRMED_SCORE:
+            with self._confirmed_lock:
+                self._confirmed_scores[key] = score
+                if len(self._confirmed_scores) > _COMPOSITE_CACHE_SIZE:
+                    self._confirmed_scores.popitem(last=False)
+        return score
+
+    def _confidence_well_formed(
+        self, identifier_type: IdentifierType, value: str
+    ) -> float:
+        """Score a well-formed identifier with the child validators."""
         scores = []
 
         # Collect scores from available validators
@@ -534,11 +1121,14 @@ class CompositeValidator(IdentifierValidatorBase):
         for validator in validators:
             try:
                 score = validator.get_confidence_score(identifier_type, value)
-                scores.append(score)
             except Exception as e:
                 logger.warning(
                     f"Confidence scoring failed for {validator.__class__.__name__}: {e}"
                 )
+                continue
+            if score >= self.early_exit_score:
+                return score  # Confident enough to skip the remaining validators
+            scores.append(score)
 
         if scores:
             # Return the maximum score (most optimistic)
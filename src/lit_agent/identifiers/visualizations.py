@@ -1,12 +1,38 @@
 """Visualization generation for validation reports."""
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 import base64
+import io
 
 logger = logging.getLogger(__name__)
 
+# Resolution of saved charts; ample for the embedded HTML report
+_CHART_DPI = 150
+
+# zlib level for chart PNGs; PNG is lossless at every level and the fastest
+# level costs only slightly larger files for these sparse charts
+_PNG_COMPRESS_LEVEL = 1
+
+# Plot settings applied on top of matplotlib's default style
+_CHART_RC_PARAMS = {"figure.figsize": (10, 6), "font.size": 10}
+
+
+@lru_cache(maxsize=None)
+def _load_pyplot() -> Any:
+    """Import pyplot and apply the chart style once.
+
+    The import is deferred to first use as it takes about 200 ms; an
+    ImportError propagates so that callers can skip visualizations.
+    """
+    import matplotlib.pyplot as plt
+
+    plt.style.use("default")
+    plt.rcParams.update(_CHART_RC_PARAMS)
+    return plt
+
 
 class ValidationVisualizer:
     """Generate visualizations for validation assessment reports."""
@@ -20,6 +46,10 @@ class ValidationVisualizer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
+        # PNG bytes of saved charts by path, embedded by generate_html_report
+        # without reading the files back
+        self._chart_bytes: Dict[str, bytes] = {}
+
     def generate_visualizations(
         self, report_data: Dict[str, Any], report_name: str
     ) -> Dict[str, str]:
@@ -33,13 +63,10 @@ class ValidationVisualizer:
             Dictionary mapping visualization names to file paths or base64 encoded images
         """
         try:
-            import matplotlib.pyplot as plt
-
-            # Set style for better-looking plots
-            plt.style.use("default")
-            plt.rcParams["figure.figsize"] = (10, 6)
-            plt.rcParams["font.size"] = 10
+            plt = _load_pyplot()
 
+            # Only the latest report's charts are held for embedding
+            self._chart_bytes.clear()
             visualizations = {}
 
             # 1. Extraction Performance Overview
@@ -114,7 +141,7 @@ class ValidationVisualizer:
     ) -> Optional[Path]:
         """Create extraction performance overview chart."""
         try:
-            import matplotlib.pyplot as plt
+            plt = _load_pyplot()
 
             fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
             fig.suptitle(
@@ -186,8 +213,7 @@ class ValidationVisualizer:
 
             # Save chart
             chart_path = self.output_dir / f"{report_name}_extraction_performance.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
+            self._save_chart(fig, chart_path)
 
             return chart_path
 
@@ -200,7 +226,7 @@ class ValidationVisualizer:
     ) -> Optional[Path]:
         """Create confidence distribution histogram."""
         try:
-            import matplotlib.pyplot as plt
+            plt = _load_pyplot()
 
             fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
             fig.suptitle(
@@ -261,8 +287,7 @@ class ValidationVisualizer:
 
             # Save chart
             chart_path = self.output_dir / f"{report_name}_confidence_distribution.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
+            self._save_chart(fig, chart_path)
 
             return chart_path
 
@@ -275,7 +300,7 @@ class ValidationVisualizer:
     ) -> Optional[Path]:
         """Create topic validation results visualization."""
         try:
-            import matplotlib.pyplot as plt
+            plt = _load_pyplot()
 
             fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
             fig.suptitle("Topic Validation Analysis", fontsize=16, fontweight="bold")
@@ -374,8 +399,7 @@ class ValidationVisualizer:
 
             # Save chart
             chart_path = self.output_dir / f"{report_name}_topic_validation.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
+            self._save_chart(fig, chart_path)
 
             return chart_path
 
@@ -388,7 +412,7 @@ class ValidationVisualizer:
     ) -> Optional[Path]:
         """Create identifier types breakdown chart."""
         try:
-            import matplotlib.pyplot as plt
+            plt = _load_pyplot()
 
             fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
             fig.suptitle("Identifier Types Analysis", fontsize=16, fontweight="bold")
@@ -441,8 +465,7 @@ class ValidationVisualizer:
 
             # Save chart
             chart_path = self.output_dir / f"{report_name}_identifier_types.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
+            self._save_chart(fig, chart_path)
 
             return chart_path
 
@@ -455,7 +478,7 @@ class ValidationVisualizer:
     ) -> Optional[Path]:
         """Create validation method comparison chart."""
         try:
-            import matplotlib.pyplot as plt
+            plt = _load_pyplot()
 
             fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
             fig.suptitle(
@@ -520,8 +543,7 @@ class ValidationVisualizer:
 
             # Save chart
             chart_path = self.output_dir / f"{report_name}_validation_comparison.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
+            self._save_chart(fig, chart_path)
 
             return chart_path
 
@@ -534,7 +556,7 @@ class ValidationVisualizer:
     ) -> Optional[Path]:
         """Create keywords frequency analysis chart."""
         try:
-            import matplotlib.pyplot as plt
+            plt = _load_pyplot()
 
             keywords = topic_analysis.get("common_keywords", {})
             if not keywords:
@@ -578,8 +600,7 @@ class ValidationVisualizer:
 
             # Save chart
             chart_path = self.output_dir / f"{report_name}_keywords_analysis.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-            plt.close()
+            self._save_chart(fig, chart_path)
 
             return chart_path
 
@@ -587,6 +608,31 @@ class ValidationVisualizer:
             logger.error(f"Error creating keywords chart: {e}")
             return None
 
+    def _save_chart(self, fig: Any, chart_path: Path) -> None:
+        """Save a chart as a fast-to-encode PNG and close its figure.
+
+        The PNG bytes are kept until the chart is embedded in an HTML report.
+
+        Args:
+            fig: Matplotlib figure to save
+            chart_path: Destination PNG path
+        """
+        plt = _load_pyplot()
+
+        buffer = io.BytesIO()
+        fig.savefig(
+            buffer,
+            format="png",
+            dpi=_CHART_DPI,
+            bbox_inches="tight",
+            pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL, "optimize": False},
+        )
+        plt.close(fig)
+
+        png_bytes = buffer.getvalue()
+        chart_path.write_bytes(png_bytes)
+        self._chart_bytes[str(chart_path)] = png_bytes
+
     def generate_html_report(
         self,
         report_data: Dict[str, Any],
@@ -605,14 +651,17 @@ class ValidationVisualizer:
         """
         html_path = self.output_dir / f"{report_name}_interactive_report.html"
 
-        # Convert image files to base64 for embedding
+        # Convert images to base64 for embedding, reading back only the files
+        # this visualizer did not just save
         embedded_images = {}
         for viz_name, viz_path in visualizations.items():
             try:
-                with open(viz_path, "rb") as f:
-                    img_data = f.read()
-                    img_base64 = base64.b64encode(img_data).decode("utf-8")
-                    embedded_images[viz_name] = f"data:image/png;base64,{img_base64}"
+                img_data = self._chart_bytes.pop(str(viz_path), None)
+                if img_data is None:
+                    with open(viz_path, "rb") as f:
+                        img_data = f.read()
+                img_base64 = base64.b64encode(img_data).decode("utf-8")
+                embedded_images[viz_name] = f"data:image/png;base64,{img_base64}"
             except Exception as e:
                 logger.warning(f"Could not embed image {viz_path}: {e}")
 
@@ -350,7 +350,7 @@ class TestErrorRecovery:
     def test_api_failure_fallback(self):
         """Test fallback when API calls fail."""
         # Mock API to always fail
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = Exception("API unavailable")
 
             validator = CompositeValidator(use_api=True, use_metapub=False)
@@ -11,6 +11,7 @@ from lit_agent.identifiers import (
     URLPatternExtractor,
     JournalURLExtractor,
     FormatValidator,
+    CompositeValidator,
 )
 
 
@@ -308,7 +309,7 @@ class TestFormatValidator:
             assert validator.validate_identifier(IdentifierType.PMID, pmid)
 
         # Invalid PMIDs
-        invalid_pmids = ["", "0", "012345", "123456789", "abc123", "123.456"]
+        invalid_pmids = ["", "0", "012345", "123456789", "abc123", "123.456", "١٢٣"]
         for pmid in invalid_pmids:
             assert not validator.validate_identifier(IdentifierType.PMID, pmid)
 
@@ -317,7 +318,7 @@ class TestFormatValidator:
         validator = FormatValidator()
 
         # Valid PMCs
-        valid_pmcs = ["PMC1", "PMC123", "PMC1234567", "PMC11239014"]
+        valid_pmcs = ["PMC1", "PMC123", "PMC1234567", "PMC11239014", "PMC0001"]
         for pmc in valid_pmcs:
             assert validator.validate_identifier(IdentifierType.PMC, pmc)
 
@@ -351,6 +352,152 @@ class TestFormatValidator:
         for doi in invalid_dois:
             assert not validator.validate_identifier(IdentifierType.DOI, doi)
 
+    def test_detect_and_validate(self):
+        """Test identifying the format of a value of unknown type."""
+        validator = FormatValidator()
+
+        assert validator.detect_and_validate("37674083") == IdentifierType.PMID
+        assert validator.detect_and_validate(" PMC11239014 ") == IdentifierType.PMC
+        assert validator.detect_and_validate("10.1002/glia.24621") == (
+            IdentifierType.DOI
+        )
+        for value in ["", "012345", "PMC0", "10.123/x", "not-an-id", None]:
+            assert validator.detect_and_validate(value) is None
+
+    def test_validate_many_matches_single_checks(self):
+        """Test that list validation agrees with per-value validation."""
+        validator = FormatValidator()
+        values = ["12345678", " 37674083 ", "", "012345", "PMC123", "10.1002/x"]
+
+        for identifier_type in IdentifierType:
+            assert validator.validate_many(identifier_type, values) == {
+                value: validator.validate_identifier(identifier_type, value)
+                for value in values
+            }
+
+    def test_composite_shares_format_validator(self):
+        """Test that child validators reuse the composite's format validator."""
+        validator = FormatValidator()
+        composite = CompositeValidator(format_validator=validator)
+
+        assert composite.format_validator is validator
+        assert composite.api_validator.format_validator is validator
+        assert composite.metapub_validator.format_validator is validator
+
+    def test_composite_validation_makes_no_requests(self):
+        """Test that validation answers from the format without child lookups."""
+        from unittest.mock import patch
+
+        composite = CompositeValidator()
+
+        with (
+            patch.object(composite.api_validator, "validate_identifier") as mock_api,
+            patch.object(
+                composite.metapub_validator, "validate_identifier"
+            ) as mock_metapub,
+        ):
+            assert composite.validate_identifier(IdentifierType.PMID, "12345678")
+            assert not composite.validate_identifier(IdentifierType.PMID, "x")
+
+        mock_api.assert_not_called()
+        mock_metapub.assert_not_called()
+
+    def test_composite_remembers_scores(self):
+        """Test that repeated scoring of an identifier reuses the first answer."""
+        from unittest.mock import patch
+
+        composite = CompositeValidator(use_metapub=False)
+
+        with patch.object(
+            composite.api_validator, "get_confidence_score", return_value=0.98
+        ) as mock_score:
+            for _ in range(3):
+                assert (
+                    composite.get_confidence_score(IdentifierType.PMID, "12345678")
+                    == 0.98
+                )
+            assert composite.get_confidence_score(IdentifierType.PMID, "x") == 0.0
+
+        mock_score.assert_called_once_with(IdentifierType.PMID, "12345678")
+
+    def test_composite_does_not_remember_fallback_scores(self):
+        """Test that a score given while the API is failing is asked again."""
+        from unittest.mock import patch
+
+        composite = CompositeValidator(use_metapub=False)
+
+        with patch.object(
+            composite.api_validator, "get_confidence_score", side_effect=[0.7, 0.98]
+        ) as mock_score:
+            assert composite.get_confidence_score(IdentifierType.PMID, "1") == 0.7
+            assert composite.get_confidence_score(IdentifierType.PMID, "1") == 0.98
+
+        assert mock_score.call_count == 2
+
+    def test_composite_skips_metapub_after_api_confirmation(self):
+        """Test that an API-confirmed identifier is not also checked by metapub."""
+        from unittest.mock import patch
+
+        composite = CompositeValidator()
+
+        with (
+            patch.object(
+                composite.api_validator, "get_confidence_score", return_value=0.98
+            ),
+            patch.object(
+                composite.metapub_validator, "get_confidence_score", return_value=0.95
+            ) as mock_metapub,
+        ):
+            assert composite.get_confidence_score(IdentifierType.PMID, "1") == 0.98
+
+        mock_metapub.assert_not_called()
+
+    def test_metapub_fetcher_is_reused(self):
+        """Test that metapub's DOI lookup is bound once per validator."""
+        from unittest.mock import Mock, patch
+
+        from lit_agent.identifiers.validators import MetapubValidator
+
+        pytest.importorskip("metapub")
+        validator = MetapubValidator()
+
+        with patch("metapub.CrossRefFetcher") as mock_fetcher_class:
+            fetcher = Mock(spec=["article_by_doi"])
+            fetcher.article_by_doi.return_value = Mock(pmid="12345678")
+            mock_fetcher_class.return_value = fetcher
+
+            assert validator.validate_identifier(IdentifierType.DOI, "10.1234/a")
+            assert validator.validate_identifier(IdentifierType.DOI, "10.1234/b")
+
+        mock_fetcher_class.assert_called_once()
+        assert fetcher.article_by_doi.call_count == 2
+
+    def test_metapub_score_reuses_lookup(self):
+        """Test that scoring a validated identifier does not look it up again."""
+        from unittest.mock import Mock, patch
+
+        from lit_agent.identifiers.validators import MetapubValidator
+
+        pytest.importorskip("metapub")
+        validator = MetapubValidator()
+
+        with patch("metapub.CrossRefFetcher") as mock_fetcher_class:
+            fetcher = Mock(spec=["article_by_doi"])
+            fetcher.article_by_doi.side_effect = [
+                RuntimeError("timeout"),
+                Mock(pmid="12345678"),
+            ]
+            mock_fetcher_class.return_value = fetcher
+
+            # Failures fall back to valid but are not remembered
+            assert validator.validate_identifier(IdentifierType.DOI, "10.1234/a")
+            assert validator.validate_identifier(IdentifierType.DOI, "10.1234/a")
+            assert validator.get_confidence_score(IdentifierType.DOI, "10.1234/a") == (
+                0.95
+            )
+
+        assert fetcher.article_by_doi.call_count == 2
+
 
 @pytest.mark.unit
 class TestAcademicIdentifier:
@@ -372,6 +519,22 @@ class TestAcademicIdentifier:
         assert identifier.is_high_confidence
         assert identifier.timestamp is not None
 
+    def test_identifier_fields_are_assignable(self):
+        """Test that declared fields stay writable on slotted identifiers."""
+        identifier = AcademicIdentifier(
+            type=IdentifierType.PMID,
+            value="12345678",
+            confidence=0.6,
+            source_url="https://pubmed.ncbi.nlm.nih.gov/12345678/",
+            extraction_method=ExtractionMethod.URL_PATTERN,
+        )
+
+        identifier.confidence = 0.9
+        identifier.topic_validation = {"is_relevant": True}
+
+        assert identifier.is_high_confidence
+        assert identifier.topic_validation == {"is_relevant": True}
+
     def test_identifier_serialization(self):
         """Test converting identifier to dictionary."""
         identifier = AcademicIdentifier(
@@ -1,9 +1,12 @@
 """Unit tests for article metadata fetching."""
 
+import io
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
-from lit_agent.identifiers.validators import NCBIAPIValidator
+from lit_agent.identifiers.validators import NCBIAPIValidator, _TokenBucket
 from lit_agent.identifiers.base import IdentifierType
 
 
@@ -21,15 +24,15 @@ class TestArticleMetadataFetching:
         pmid = validator._get_pmid_for_identifier(IdentifierType.PMID, "12345678")
         assert pmid == "12345678"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_pmid_for_doi_converts(self, mock_get, validator):
         """Test DOI to PMID conversion."""
         # Mock ID converter response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "records": [{"pmid": "12345678", "doi": "10.1234/test"}]
-        }
+        mock_response.content = json.dumps(
+            {"records": [{"pmid": "12345678", "doi": "10.1234/test"}]}
+        ).encode()
         mock_get.return_value = mock_response
 
         pmid = validator._get_pmid_for_identifier(IdentifierType.DOI, "10.1234/test")
@@ -111,7 +114,7 @@ class TestArticleMetadataFetching:
         metadata = validator._parse_efetch_xml(invalid_xml, "12345678")
         assert metadata is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_article_metadata_success(self, mock_get, validator):
         """Test successful metadata fetching."""
         xml_response = """<?xml version="1.0"?>
@@ -130,7 +133,7 @@ class TestArticleMetadataFetching:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = xml_response
+        mock_response.raw = io.BytesIO(xml_response.encode("utf-8"))
         mock_get.return_value = mock_response
 
         metadata = validator._fetch_article_metadata("12345678")
@@ -139,7 +142,7 @@ class TestArticleMetadataFetching:
         assert metadata["title"] == "Astrocyte Function in Neural Networks"
         assert metadata["abstract"] == "Study of astrocyte biology and function."
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_article_metadata_http_error(self, mock_get, validator):
         """Test handling of HTTP errors."""
         mock_response = Mock()
@@ -175,3 +178,134 @@ class TestArticleMetadataFetching:
         """Test with invalid identifier format."""
         metadata = validator.get_article_metadata(IdentifierType.DOI, "invalid-doi")
         assert metadata is None
+
+    def test_session_retries_rate_limited_responses(self, validator):
+        """Test that the pooled session retries 429s but not connection errors."""
+        retries = validator._session.get_adapter(validator.api_base_url).max_retries
+
+        assert 429 in retries.status_forcelist
+        assert retries.connect == 0
+        assert not retries.raise_on_status
+
+    @patch("requests.Session.get")
+    def test_validate_many_batches_requests(self, mock_get, validator):
+        """Test that well-formed identifiers share one ID converter request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            {"records": [{"requested-id": "12345678", "pmid": "12345678"}]}
+        ).encode()
+        mock_get.return_value = mock_response
+
+        results = validator.validate_many(
+            IdentifierType.PMID, ["12345678", "99999999", "not-a-pmid", "12345678"]
+        )
+
+        assert results == {"12345678": True, "99999999": False, "not-a-pmid": False}
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["params"]["ids"] == "12345678,99999999"
+
+    def test_token_bucket_waits_once_burst_is_spent(self):
+        """Test that the limiter allows a burst and then spaces requests."""
+        bucket = _TokenBucket(rate=2.0, capacity=2)
+
+        with patch("time.sleep") as mock_sleep:
+            bucket.acquire()
+            bucket.acquire()
+            mock_sleep.assert_not_called()
+
+            bucket.acquire()
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args.args[0] == pytest.approx(0.5, abs=0.01)
+
+    @patch("requests.Session.get")
+    def test_persistent_response_cache(self, mock_get, tmp_path):
+        """Test NCBI answers persist across validators sharing a cache directory."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            {"records": [{"pmid": "12345678", "doi": "10.1234/test"}]}
+        ).encode()
+        mock_get.return_value = mock_response
+
+        first = NCBIAPIValidator(rate_limit=0, cache_dir=str(tmp_path))
+        assert first.validate_identifier(IdentifierType.DOI, "10.1234/test")
+        first.close()
+
+        second = NCBIAPIValidator(rate_limit=0, cache_dir=str(tmp_path))
+        assert second.validate_identifier(IdentifierType.DOI, "10.1234/test")
+        assert second.validate_many(IdentifierType.DOI, ["10.1234/test"]) == {
+            "10.1234/test": True
+        }
+        mock_get.assert_called_once()
+        second.close()
+
+    @patch("requests.Session.get")
+    def test_get_article_metadata_many_batches_requests(self, mock_get, validator):
+        """Test that several PMIDs are fetched with one efetch request."""
+        xml_response = """<?xml version="1.0"?>
+        <PubmedArticleSet>
+            <PubmedArticle>
+                <MedlineCitation>
+                    <PMID>22222222</PMID>
+                    <Article><ArticleTitle>Second</ArticleTitle></Article>
+                </MedlineCitation>
+            </PubmedArticle>
+            <PubmedArticle>
+                <MedlineCitation>
+                    <PMID>11111111</PMID>
+                    <Article><ArticleTitle>First</ArticleTitle></Article>
+                </MedlineCitation>
+            </PubmedArticle>
+        </PubmedArticleSet>"""
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.raw = io.BytesIO(xml_response.encode("utf-8"))
+        mock_get.return_value = mock_response
+
+        results = dict(
+            validator.get_article_metadata_many(
+                ["11111111", "22222222", "33333333", "not-a-pmid", "11111111"]
+            )
+        )
+
+        assert results["11111111"]["title"] == "First"
+        assert results["22222222"]["title"] == "Second"
+        assert results["33333333"] is None
+        assert results["not-a-pmid"] is None
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["params"]["id"] == (
+            "11111111,22222222,33333333"
+        )
+
+        # Answers, including the missing PMID, are served from the cache
+        assert validator._fetch_article_metadata("33333333") is None
+        mock_get.assert_called_once()
+
+    def test_memory_response_cache_is_bounded(self, validator, monkeypatch):
+        """Test that the least recently used answers are dropped first."""
+        monkeypatch.setattr("lit_agent.identifiers.validators._MEMORY_CACHE_SIZE", 2)
+
+        validator._store_cached("a", {"pmid": "1"})
+        validator._store_cached("b", None)
+        assert validator._get_cached("a") == {"pmid": "1"}
+        validator._store_cached("c", {"pmid": "3"})
+
+        assert list(validator._response_cache) == ["a", "c"]
+
+    @patch("requests.Session.get")
+    def test_api_key_is_sent_to_efetch(self, mock_get):
+        """Test that an API key raises the default rate and is sent to efetch."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        validator = NCBIAPIValidator(api_key="secret")
+        assert validator.rate_limit == 0.11
+
+        validator._fetch_article_metadata("12345678")
+        assert mock_get.call_args.kwargs["params"]["api_key"] == "secret"
+
+        validator._query_ncbi_api(IdentifierType.PMID, "12345678")
+        assert "api_key" not in mock_get.call_args.kwargs["params"]
@@ -183,6 +183,21 @@ class TestValidationReporter:
         assert len(classifications["likely_irrelevant"]) == 1  # False relevance
         assert len(classifications["medium_confidence_relevant"]) == 1  # 70% confidence
 
+    def test_classify_irrelevant_paper_without_confidence(self, reporter):
+        """Test that an irrelevant paper is classified without its confidence."""
+        identifier = AcademicIdentifier(
+            type=IdentifierType.PMID,
+            value="12345678",
+            confidence=0.9,
+            source_url="https://test.com",
+            extraction_method=ExtractionMethod.URL_PATTERN,
+            topic_validation={"is_relevant": False, "confidence": None},
+        )
+
+        classifications = reporter._classify_papers([identifier])
+
+        assert len(classifications["likely_irrelevant"]) == 1
+
     def test_generate_recommendations(self, reporter):
         """Test recommendation generation."""
         # Test with low success rate
@@ -242,11 +257,20 @@ class TestValidationReporter:
         assert (output_dir / "test_report.json").exists()
         assert (output_dir / "test_report_summary.txt").exists()
         assert (output_dir / "test_report_papers.csv").exists()
+        assert (output_dir / "test_report_papers.jsonl").exists()
 
         # Check JSON content
         with open(output_dir / "test_report.json") as f:
             saved_report = json.load(f)
             assert saved_report["metadata"]["report_name"] == "test_report"
+            assert "detailed_papers" not in saved_report
+            assert saved_report["detailed_papers_path"] == "test_report_papers.jsonl"
+        assert "detailed_papers_path" not in report
+
+        # Detailed papers are written one JSON object per line
+        with open(output_dir / "test_report_papers.jsonl") as f:
+            papers = [json.loads(line) for line in f]
+        assert papers == json.loads(json.dumps(report["detailed_papers"]))
 
     def test_format_text_summary(self, reporter, sample_results):
         """Test text summary formatting."""
@@ -275,3 +299,78 @@ class TestValidationReporter:
             assert len(rows) == 3
             assert "identifier_type" in rows[0]
             assert "topic_is_relevant" in rows[0]  # Flattened topic validation
+
+    def test_analyzers_with_no_identifiers(self, reporter):
+        """Test analyzers return empty results without identifiers."""
+        validation = reporter._analyze_validation_performance([])
+        assert validation["confidence_ranges"]["total"] == 0
+        assert "avg_confidence" not in validation
+
+        topic = reporter._analyze_topic_validation([])
+        assert topic["topic_validation_available"] is False
+
+        distribution = reporter._analyze_confidence_distribution([])
+        assert sum(distribution.values()) == 0
+
+        # Results must not alias the shared empty constants
+        distribution["below_0.5"] += 1
+        assert reporter._analyze_confidence_distribution([])["below_0.5"] == 0
+
+    def test_calculate_f1_metrics(self, reporter, sample_identifiers):
+        """Test F1 metric counts for extraction and topic validation."""
+        metrics = reporter.calculate_f1_metrics(sample_identifiers)
+
+        extraction = metrics["extraction_f1"]
+        assert extraction["true_positives"] == 2  # 0.95 and 0.85
+        assert extraction["medium_confidence"] == 1  # 0.75
+        assert extraction["false_positives"] == 0
+        assert extraction["support"] == 3
+
+        topic = metrics["topic_validation_f1"]
+        assert topic["validation_available"] is True
+        assert topic["true_positives"] == 1  # relevant, 85
+        assert topic["false_positives"] == 1  # relevant, 70
+        assert topic["false_negatives"] == 1  # irrelevant, 90
+        assert topic["f1_score"] == pytest.approx(0.5)
+        assert topic["total_relevant"] == 2
+        assert topic["total_irrelevant"] == 1
+        assert topic["avg_confidence"] == pytest.approx(245 / 3)
+
+    def test_categorize_failure(self, reporter):
+        """Test failed URL categorization and its precedence."""
+        assert reporter._categorize_failure("https://x.org/a.PDF") == "pdf_links"
+        assert (
+            reporter._categorize_failure("https://ncbi.nlm.nih.gov/a.pdf")
+            == "pdf_links"
+        )
+        assert (
+            reporter._categorize_failure("https://dx.doi.org/10.1/x")
+            == "redirect_issues"
+        )
+        assert reporter._categorize_failure("https://x.org/Login") == "access_denied"
+        assert (
+            reporter._categorize_failure("https://www.ncbi.nlm.nih.gov/pmc/")
+            == "format_issues"
+        )
+        assert reporter._categorize_failure("https://x.org/a") == "unknown_errors"
+
+    def test_html_report_embeds_saved_charts(self, reporter, sample_results, temp_dir):
+        """Test that charts are embedded from memory rather than read back."""
+        pytest.importorskip("matplotlib")
+        from lit_agent.identifiers.visualizations import ValidationVisualizer
+
+        report = reporter.generate_validation_report(sample_results, "test_report")
+        visualizer = ValidationVisualizer(output_dir=temp_dir)
+        visualizations = visualizer.generate_visualizations(report, "test_report")
+
+        assert "identifier_types" in visualizations
+        chart_path = Path(visualizations["identifier_types"])
+        assert chart_path.read_bytes().startswith(b"\x89PNG")
+
+        chart_path.unlink()
+        html_path = visualizer.generate_html_report(
+            report, visualizations, "test_report"
+        )
+        assert html_path.read_text().count("data:image/png;base64,") == len(
+            visualizations
+        )
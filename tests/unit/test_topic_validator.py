@@ -106,6 +106,27 @@ class TestTopicValidator:
 
         assert result["confidence"] == 100  # Should be clamped to 100
 
+    @patch("lit_agent.identifiers._json.orjson", None)
+    @patch("litellm.completion")
+    def test_llm_analysis_without_orjson(self, mock_completion, validator):
+        """Test LLM responses are parsed with the stdlib when orjson is absent."""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {
+                "is_relevant": False,
+                "confidence": 40,
+                "reasoning": "Test reasoning",
+                "keywords_found": [],
+            }
+        )
+        mock_completion.return_value = mock_response
+
+        result = validator._analyze_with_llm("Title", "Abstract", "12345678")
+
+        assert result["is_relevant"] is False
+        assert result["confidence"] == 40
+
     @patch("litellm.completion")
     def test_llm_analysis_invalid_json(self, mock_completion, validator):
         """Test handling of invalid JSON response."""
@@ -193,6 +214,74 @@ class TestTopicValidator:
             assert result2 == expected_result
             assert mock_analyze.call_count == 1  # No additional calls
 
+    @patch("litellm.completion")
+    def test_batch_validation(self, mock_completion, validator):
+        """Test several papers are validated with a single LLM request."""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "id": 1,
+                        "is_relevant": True,
+                        "confidence": 90,
+                        "reasoning": "Astrocyte focus",
+                        "keywords_found": ["astrocyte"],
+                    },
+                    {
+                        "id": "2",
+                        "is_relevant": False,
+                        "confidence": 150,
+                        "reasoning": "Cardiac study",
+                        "keywords_found": "none",
+                    },
+                    # Paper 3 is missing from the response
+                ]
+            }
+        )
+        mock_completion.return_value = mock_response
+
+        titles = ["Astrocyte biology", "Cardiac muscle", "Astrocyte GFAP"]
+        results = validator.validate_topic_relevance_batch(
+            titles, ["", "", ""], batch_size=5
+        )
+
+        assert mock_completion.call_count == 1
+        assert results[0]["is_relevant"] is True
+        assert results[1]["confidence"] == 100  # Clamped
+        assert results[1]["keywords_found"] == []
+        assert "fallback" in results[2]["reasoning"].lower()
+
+        # Valid results are cached; the missing one is retried next time
+        assert validator.get_cache_stats()["cache_size"] == 2
+        assert validator.validate_topic_relevance("Astrocyte biology", "") == results[0]
+
+    def test_batch_validation_splits_batches(self, validator):
+        """Test uncached papers are split into batches and duplicates shared."""
+        result = {
+            "is_relevant": True,
+            "confidence": 80,
+            "reasoning": "Test",
+            "keywords_found": [],
+        }
+        with patch.object(
+            validator,
+            "_analyze_batch_with_llm",
+            side_effect=lambda titles, abstracts: [dict(result) for _ in titles],
+        ) as mock_batch:
+            results = validator.validate_topic_relevance_batch(
+                ["A", "B", "C", "A"], batch_size=2
+            )
+
+        assert mock_batch.call_count == 2
+        assert [call.args[0] for call in mock_batch.call_args_list] == [
+            ["A", "B"],
+            ["C"],
+        ]
+        assert len(results) == 4
+        assert results[0] == results[3] == result
+
     def test_cache_stats(self, validator):
         """Test cache statistics."""
         stats = validator.get_cache_stats()
@@ -203,6 +292,35 @@ class TestTopicValidator:
         stats = validator.get_cache_stats()
         assert stats["cache_size"] == 1
 
+    def test_cache_key_depends_on_domain(self, validator):
+        """Test cache keys differ between research domains."""
+        other = TopicValidator(research_domain="cancer research")
+        assert validator._create_cache_key(
+            "Title", "Abstract"
+        ) != other._create_cache_key("Title", "Abstract")
+
+    def test_persistent_cache(self, tmp_path):
+        """Test results persist across validators sharing a cache directory."""
+        expected_result = {
+            "is_relevant": True,
+            "confidence": 85,
+            "reasoning": "Test",
+            "keywords_found": ["test"],
+        }
+
+        first = TopicValidator(rate_limit=0, cache_dir=str(tmp_path))
+        with patch.object(first, "_analyze_with_llm", return_value=expected_result):
+            first.validate_topic_relevance("Title", "Abstract")
+        first.close()
+
+        second = TopicValidator(rate_limit=0, cache_dir=str(tmp_path))
+        with patch.object(second, "_analyze_with_llm") as mock_analyze:
+            result = second.validate_topic_relevance("Title", "Abstract")
+            mock_analyze.assert_not_called()
+        assert result == expected_result
+        assert second.get_cache_stats()["cache_size"] == 1
+        second.close()
+
     def test_clear_cache(self, validator):
         """Test cache clearing."""
         validator._validation_cache["test"] = {"test": "data"}
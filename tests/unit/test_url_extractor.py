@@ -0,0 +1,189 @@
+"""Unit tests for deepsearch URL extraction."""
+
+import dataclasses
+import os
+
+import pytest
+
+from lit_agent.identifiers.url_extractor import (
+    DeepsearchURLExtractor,
+    extract_deepsearch_urls,
+)
+
+
+@pytest.mark.unit
+class TestDeepsearchURLExtractor:
+    """Test deepsearch URL extraction and classification."""
+
+    @pytest.fixture
+    def extractor(self):
+        """Create a DeepsearchURLExtractor instance."""
+        return DeepsearchURLExtractor()
+
+    def test_classify_known_domains(self, extractor):
+        """Test that listed domains override the URL heuristics."""
+        assert extractor._classify_url(
+            "https://pubmed.ncbi.nlm.nih.gov/12345678/", "pubmed.ncbi.nlm.nih.gov"
+        )
+        assert not extractor._classify_url(
+            "https://en.wikipedia.org/wiki/Journal", "en.wikipedia.org"
+        )
+
+    def test_classify_unknown_domains(self, extractor):
+        """Test heuristic classification of unlisted domains."""
+        assert extractor._classify_url(
+            "https://Journals.Example.COM/abc", "Journals.Example.COM"
+        )
+        assert extractor._classify_url("https://bar.net/x?doi=1", "bar.net")
+        assert not extractor._classify_url(
+            "https://shop.example.com/item", "shop.example.com"
+        )
+
+    def test_extract_domain(self, extractor):
+        """Test domain extraction with and without a protocol."""
+        assert extractor._extract_domain("https://www.nature.com/articles/x") == (
+            "www.nature.com"
+        )
+        assert extractor._extract_domain("http://arxiv.org") == "arxiv.org"
+        assert extractor._extract_domain("example.org/path") == "example.org"
+        assert (
+            extractor._extract_domain("https://web.archive.org/web/1/https://x.org/")
+            == "web.archive.org"
+        )
+
+    def test_extract_urls_from_file(self, extractor, tmp_path):
+        """Test citation extraction from a markdown file."""
+        bibliography = tmp_path / "refs.md"
+        bibliography.write_text(
+            "[1](https://pubmed.ncbi.nlm.nih.gov/123/) "
+            "[2](https://en.wikipedia.org/wiki/Astrocyte)\n",
+            encoding="utf-8",
+        )
+
+        urls = extractor.extract_urls_from_file(bibliography)
+
+        assert [u.citation_number for u in urls] == ["1", "2"]
+        assert [u.is_academic for u in urls] == [True, False]
+        assert urls[0].domain == "pubmed.ncbi.nlm.nih.gov"
+        assert urls[0].source_file == "refs.md"
+
+        # Classifications are read-only once extracted
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            urls[0].is_academic = False
+
+    def test_extract_urls_from_directory_deduplicates(self, extractor, tmp_path):
+        """Test that duplicates are dropped but still counted in statistics."""
+        (tmp_path / "a.md").write_text(
+            "[1](https://arxiv.org/abs/1) [2](https://www.youtube.com/watch?v=1)\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "b.md").write_text(
+            "[1](https://arxiv.org/abs/1) [2](https://arxiv.org/abs/2)\n",
+            encoding="utf-8",
+        )
+
+        urls, stats = extractor.extract_urls_from_directory(tmp_path, deduplicate=True)
+
+        assert sorted(u.url for u in urls) == [
+            "https://arxiv.org/abs/1",
+            "https://arxiv.org/abs/2",
+            "https://www.youtube.com/watch?v=1",
+        ]
+        assert stats["total_urls"] == 4
+        assert stats["academic_urls"] == 3
+        assert stats["non_academic_urls"] == 1
+        assert stats["duplicates_removed"] == 1
+        assert stats["unique_domains"] == 2
+
+    def test_extract_non_ascii_urls(self, extractor, tmp_path):
+        """Test that cited URLs are decoded from the raw UTF-8 file bytes."""
+        bibliography = tmp_path / "refs.md"
+        bibliography.write_text(
+            "Zitiert – [3](https://de.wikipedia.org/wiki/Astrozyt_ä)\n",
+            encoding="utf-8",
+        )
+
+        urls = extractor.extract_urls_from_file(bibliography)
+
+        assert len(urls) == 1
+        assert urls[0].url == "https://de.wikipedia.org/wiki/Astrozyt_ä"
+        assert urls[0].citation_number == "3"
+
+    def test_get_domain_breakdown(self, extractor, tmp_path):
+        """Test grouping URLs by domain in first-seen order."""
+        bibliography = tmp_path / "refs.md"
+        bibliography.write_text(
+            "[1](https://arxiv.org/abs/1) [2](https://www.nature.com/x) "
+            "[3](https://arxiv.org/abs/2)\n",
+            encoding="utf-8",
+        )
+
+        breakdown = extractor.get_domain_breakdown(
+            extractor.extract_urls_from_file(bibliography)
+        )
+
+        assert breakdown == {
+            "arxiv.org": ["https://arxiv.org/abs/1", "https://arxiv.org/abs/2"],
+            "www.nature.com": ["https://www.nature.com/x"],
+        }
+        assert type(breakdown) is dict
+
+    def test_extract_academic_only(self, extractor, tmp_path):
+        """Test that skipped non-academic URLs are still counted."""
+        (tmp_path / "a.md").write_text(
+            "[1](https://arxiv.org/abs/1) [2](https://www.youtube.com/watch?v=1) "
+            "[3](https://www.youtube.com/watch?v=1)\n",
+            encoding="utf-8",
+        )
+
+        urls, stats = extractor.extract_urls_from_directory(
+            tmp_path, deduplicate=True, academic_only=True
+        )
+
+        assert [u.url for u in urls] == ["https://arxiv.org/abs/1"]
+        assert stats["academic_urls"] == 1
+        assert stats["non_academic_urls"] == 2
+        assert stats["duplicates_removed"] == 1
+        assert stats["unique_domains"] == 2
+
+    def test_domains_are_shared(self, extractor, tmp_path):
+        """Test that URLs from one domain share a single domain string."""
+        (tmp_path / "a.md").write_text(
+            "[1](https://arxiv.org/abs/1) [2](https://arxiv.org/abs/2)\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "b.md").write_text(
+            "[1](https://arxiv.org/abs/3)\n", encoding="utf-8"
+        )
+
+        urls, _ = extractor.extract_urls_from_directory(tmp_path)
+
+        assert len(urls) == 3
+        assert all(u.domain is urls[0].domain for u in urls)
+
+    def test_extract_deepsearch_urls_cache(self, tmp_path, monkeypatch):
+        """Test that cached results are reused until the inputs change."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        bibliography = input_dir / "a.md"
+        bibliography.write_text("[1](https://arxiv.org/abs/1)\n", encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+
+        first = extract_deepsearch_urls(str(input_dir), cache_dir=str(cache_dir))
+        assert first[0] == ["https://arxiv.org/abs/1"]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("extraction should be served from the cache")
+
+        with monkeypatch.context() as m:
+            m.setattr(DeepsearchURLExtractor, "extract_urls_from_directory", fail)
+            assert (
+                extract_deepsearch_urls(str(input_dir), cache_dir=str(cache_dir))
+                == first
+            )
+
+        # Editing a file invalidates the cache
+        bibliography.write_text("[1](https://arxiv.org/abs/2)\n", encoding="utf-8")
+        os.utime(bibliography, ns=(0, bibliography.stat().st_mtime_ns + 10**9))
+        second = extract_deepsearch_urls(str(input_dir), cache_dir=str(cache_dir))
+        assert second[0] == ["https://arxiv.org/abs/2"]